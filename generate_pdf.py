@@ -1,9 +1,137 @@
 #!/usr/bin/env python3
-"""Generate XGE whitepaper PDF — v2 with tier system and advanced features."""
+"""Generate XGE whitepaper PDF — v2 with tier system and advanced features.
+
+Requires fpdf2 (``pip install fpdf2``), the maintained fork of pyfpdf.
+
+build() assembles the document fully in memory and returns the PDF bytes;
+nothing touches the filesystem except the CLI entry point, which writes
+the bytes to OUTPUT_PATH.
+"""
+
+import copy
+import functools
 
 from fpdf import FPDF
+from fpdf.drawing_primitives import convert_to_device_color
+from fpdf.enums import MethodReturnValue
 
 FONT_DIR = "/System/Library/Fonts/Supplemental/"
+OUTPUT_PATH = "/Users/platomico/Desktop/projects/xge/XGE_Basis_Trade_System.pdf"
+
+# ── Static report data (built once at import, reused every build) ──
+_TIER1_ROWS = (
+    ("S\xedmbolos", "BTC/USDT, ETH/USDT, SOL/USDT, XRP/USDT"),
+    ("Capital asignado", "1.260 USDT"),
+    ("Tama\xf1o por par", "315 USDT (1.260 / 4)"),
+    ("M\xe1ximo posiciones abiertas", "4"),
+    ("Funding m\xednimo por periodo", "0,008% (8,76% anualizado)"),
+    ("Stop loss por par", "-1,575 USDT (0,5% de 315)"),
+    ("Alerta de delta drift", "6,30 USDT (2% de 315)"),
+)
+
+_TIER2_ROWS = (
+    ("S\xedmbolos", "WLD/USDT, NEAR/USDT, AVAX/USDT"),
+    ("Capital asignado", "360 USDT"),
+    ("Tama\xf1o por par", "180 USDT"),
+    ("M\xe1ximo posiciones abiertas", "2"),
+    ("Funding m\xednimo por periodo", "0,015% (16,4% anualizado)"),
+    ("Stop loss por par", "-0,90 USDT (0,5% de 180)"),
+    ("Alerta de delta drift", "3,60 USDT (2% de 180)"),
+)
+
+_FEES_ROWS = (
+    ("Bitget", "0,10%", "0,02%", "0,06%"),
+    ("OKX", "0,10%", "0,02%", "0,05%"),
+    ("MEXC", "0,02%", "0,00%", "0,06%"),
+)
+
+_STOP_LOSS_ROWS = (
+    ("Tier 1", "315 USDT", "0,5%", "-1,575 USDT"),
+    ("Tier 2", "180 USDT", "0,5%", "-0,900 USDT"),
+)
+
+_MODULES_ROWS = (
+    ("ws_collector", "Precios bid/ask en tiempo real (WebSocket)", "Continuo"),
+    ("funding_collector", "Funding rates (WS o REST fallback)", "5 min"),
+    ("redis_cache", "Almac\xe9n de datos en memoria", "Continuo"),
+    ("pair_selector", "Validaci\xf3n multicapa de oportunidades", "Por entrada"),
+    ("breakeven", "C\xe1lculo de viabilidad con fees reales", "Por entrada"),
+    ("tier_config", "Definici\xf3n de tiers, capital y comisiones", "Est\xe1tico"),
+    ("strategy", "L\xf3gica de entrada/salida con tiers", "60 seg"),
+    ("executor", "Ejecuci\xf3n de \xf3rdenes (paper/live)", "Por se\xf1al"),
+    ("position_manager", "Gesti\xf3n de posiciones en Redis", "Por evento"),
+    ("delta_monitor", "Monitorizaci\xf3n de delta y basis", "30 seg"),
+    ("metrics", "C\xe1lculo de m\xe9tricas y reportes", "Bajo demanda"),
+    ("email_notifier", "Notificaciones de apertura/cierre", "Por evento"),
+)
+
+_METRICS_ROWS = (
+    ("funding_yield_real", "Rendimiento real del funding cobrado vs. capital"),
+    ("basis_cost", "Coste medio del spread al entrar"),
+    ("net_pnl_ratio", "PnL neto como porcentaje del capital usado"),
+    ("win_rate", "Porcentaje de trades con PnL positivo"),
+    ("avg_pnl_per_trade", "PnL medio por operaci\xf3n"),
+    ("funding_vs_drift", "Ratio funding cobrado vs. p\xe9rdida por drift"),
+    ("projected_monthly_yield", "Rendimiento mensual proyectado"),
+    ("capital_deployed", "Capital actualmente en posiciones"),
+    ("capital_free", "Capital disponible para nuevas posiciones"),
+    ("reserve_status", "Estado de la reserva (OK o ALERT)"),
+    ("best_pair / worst_pair", "Par con mejor/peor rendimiento acumulado"),
+)
+
+_SCALING_ROWS = (
+    ("Exchanges", "3", "6\u20138", "10\u201312"),
+    ("Pares por tier", "4 + 3", "15 + 10", "25 + 15"),
+    ("Posiciones simult\xe1neas", "6", "20\u201330", "40\u201350"),
+    ("Tama\xf1o por posici\xf3n", "180\u2013315", "2K\u20135K", "10K\u201330K"),
+    ("Fee (VIP)", "Est\xe1ndar", "Reducido", "VIP"),
+    ("Coste por ciclo", "~0,32%", "~0,24%", "~0,16%"),
+    ("Retorno estimado", "4\u20138%", "5\u201310%", "6\u201312%"),
+)
+
+_RISKS_ROWS = (
+    ("Funding negativo", "Media", "Bajo", "Cierre tras 2 periodos negativos"),
+    ("Delta drift", "Media", "Bajo", "Monitor cada 30s, rebalanceo auto"),
+    ("Slippage entrada", "Baja", "Bajo", "Spread < 0,05% como filtro"),
+    ("Liquidaci\xf3n perp", "Muy baja", "Alto", "Delta-neutral + stop loss 0,5%"),
+    ("Exchange down", "Baja", "Medio", "Diversificaci\xf3n en 3\u201312 exchanges"),
+    ("Hackeo exchange", "Muy baja", "Alto", "M\xe1x. 15% capital por exchange"),
+    ("Low funding period", "Alta", "Bajo", "No abrir si breakeven > 3 d\xedas"),
+    ("Reserva da\xf1ada", "Baja", "Alto", "Cierre escalonado autom\xe1tico"),
+)
+
+_PROJECTION_2K_ROWS = (
+    ("Conservador", "0,008%/per.", "$1,44", "$17,28", "0,86%"),
+    ("Moderado", "0,015%/per.", "$4,32", "$51,84", "2,59%"),
+    ("Optimista", "0,03%/per.", "$11,88", "$142,56", "7,13%"),
+)
+
+_PROJECTION_100K_ROWS = (
+    ("Conservador", "0,008%/per.", "$130", "$1.560", "1,56%"),
+    ("Moderado", "0,012%/per.", "$380", "$4.560", "4,56%"),
+    ("Optimista", "0,018%/per.", "$750", "$9.000", "9,00%"),
+)
+
+_PROJECTION_1M_ROWS = (
+    ("Conservador", "0,008%/per.", "$3.194", "$38.320", "3,83%"),
+    ("Moderado", "0,012%/per.", "$5.693", "$68.320", "6,83%"),
+    ("Optimista", "0,018%/per.", "$9.579", "$114.950", "11,50%"),
+)
+
+_COMPARISON_ROWS = (
+    ("Cuenta ahorro", "3\u20134%", "$30\u201340K", "Muy bajo", "Nula"),
+    ("Bonos EE.UU.", "4\u20135%", "$40\u201350K", "Bajo", "Baja"),
+    ("S&P 500", "8\u201310%", "$80\u2013100K", "Medio", "Alta"),
+    ("Basis trade XGE", "4\u201312%", "$38\u2013115K", "Medio-bajo", "Muy baja"),
+    ("Holding BTC", "Variable", "Variable", "Muy alto", "Muy alta"),
+)
+
+
+# Column widths / headers shared by several tables (tuples: reused, never
+# copied defensively by the table helper)
+_W2_PARAM = (55, 115)
+_W5_PROJECTION = (30, 35, 30, 30, 30)
+_PROJECTION_HEADERS = ("Escenario", "Funding medio", "Neto/mes", "Neto/a\u00f1o", "% Anual")
 
 
 class XGEReport(FPDF):
@@ -15,28 +143,158 @@ class XGEReport(FPDF):
     GREEN = (0, 128, 60)
     RED = (180, 30, 30)
 
+    FONT_FILES = (
+        ("Arial", "", "Arial.ttf"),
+        ("Arial", "B", "Arial Bold.ttf"),
+        ("Arial", "I", "Arial Italic.ttf"),
+        ("Arial", "BI", "Arial Bold Italic.ttf"),
+        ("Mono", "", "Courier New.ttf"),
+        ("Mono", "B", "Courier New Bold.ttf"),
+    )
+
+    # Parsed font objects shared by all instances — fpdf re-parses the whole
+    # TTF (cmap, glyf, hmtx) on every add_font call, which dominates
+    # instantiation time when generating several documents in a row.
+    _font_cache: dict[str, object] = {}
+
     def __init__(self):
         super().__init__()
-        self.add_font("Arial", "", FONT_DIR + "Arial.ttf", uni=True)
-        self.add_font("Arial", "B", FONT_DIR + "Arial Bold.ttf", uni=True)
-        self.add_font("Arial", "I", FONT_DIR + "Arial Italic.ttf", uni=True)
-        self.add_font("Arial", "BI", FONT_DIR + "Arial Bold Italic.ttf", uni=True)
-        self.add_font("Mono", "", FONT_DIR + "Courier New.ttf", uni=True)
-        self.add_font("Mono", "B", FONT_DIR + "Courier New Bold.ttf", uni=True)
+        self._register_fonts()
+        # Per-character advance memo — the document reuses a small vocabulary
+        # (Spanish text, digits, a few box-drawing chars) across hundreds of
+        # cell/multi_cell calls, so most width lookups are repeats.
+        self._char_width_cache: dict[tuple, float] = {}
+        # Last-applied state caches so hot helpers can re-issue their
+        # set_font/set_*_color calls without paying for lookup/conversion
+        # when the state is already correct. The object-identity checks
+        # guard against fpdf2 restoring state behind our back (add_page
+        # reassigns colors directly without going through the setters).
+        self._last_font: tuple | None = None
+        self._last_font_obj = None
+        self._last_text_rgb: tuple | None = None
+        self._last_text_obj = None
+        self._last_fill_rgb: tuple | None = None
+        self._last_fill_obj = None
+        self._last_draw_rgb: tuple | None = None
+        self._last_draw_obj = None
+
+    def set_font(self, family="", style="", size=0):
+        # fpdf2 internals may pass a TextEmphasis object as style when
+        # restoring state — only guard the plain-string calls our helpers make.
+        if family and size and isinstance(style, str):
+            key = (family.lower(), "".join(sorted(style.upper())), size)
+            if key == self._last_font and self.current_font is self._last_font_obj:
+                return
+        else:
+            key = None
+        super().set_font(family, style, size)
+        self._last_font = key
+        self._last_font_obj = self.current_font
+
+    # DeviceRGB objects and serialized "r g b rg"/"R G B RG" ops, built
+    # once per distinct color so changing color never re-formats floats.
+    _color_cache: dict[tuple, tuple] = {}
+
+    @classmethod
+    def _device_color(cls, rgb):
+        cached = cls._color_cache.get(rgb)
+        if cached is None:
+            color = convert_to_device_color(*rgb)
+            op = color.serialize()
+            cached = (color, op.lower(), op.upper())
+            cls._color_cache[rgb] = cached
+        return cached
+
+    def set_text_color(self, r, g=-1, b=-1):
+        if not isinstance(r, (int, float)):
+            super().set_text_color(r, g, b)
+            return
+        if (r, g, b) == self._last_text_rgb and self.text_color is self._last_text_obj:
+            return
+        self.text_color = self._device_color((r, g, b))[0]
+        self._last_text_rgb = (r, g, b)
+        self._last_text_obj = self.text_color
+
+    def set_fill_color(self, r, g=-1, b=-1):
+        if not isinstance(r, (int, float)):
+            super().set_fill_color(r, g, b)
+            return
+        if (r, g, b) == self._last_fill_rgb and self.fill_color is self._last_fill_obj:
+            return
+        color, fill_op, _ = self._device_color((r, g, b))
+        if color != self.fill_color:
+            self.fill_color = color
+            if self.page > 0:
+                self._out(fill_op)
+        self._last_fill_rgb = (r, g, b)
+        self._last_fill_obj = self.fill_color
+
+    def set_draw_color(self, r, g=-1, b=-1):
+        if not isinstance(r, (int, float)):
+            super().set_draw_color(r, g, b)
+            return
+        if (r, g, b) == self._last_draw_rgb and self.draw_color is self._last_draw_obj:
+            return
+        color, _, draw_op = self._device_color((r, g, b))
+        if color != self.draw_color:
+            self.draw_color = color
+            if self.page > 0:
+                self._out(draw_op)
+        self._last_draw_rgb = (r, g, b)
+        self._last_draw_obj = self.draw_color
+
+    def get_string_width(self, s, normalized=False, markdown=False):
+        if markdown:
+            return super().get_string_width(s, normalized, markdown)
+        cache = self._char_width_cache
+        font_key = (self.font_family, self.font_style, self.font_size_pt, normalized)
+        total = 0.0
+        for char in s:
+            key = (font_key, char)
+            width = cache.get(key)
+            if width is None:
+                width = super().get_string_width(char, normalized, markdown)
+                cache[key] = width
+            total += width
+        return total
+
+    def _register_fonts(self):
+        """Register report fonts, parsing each TTF only once per process."""
+        for family, style, filename in self.FONT_FILES:
+            fontkey = f"{family.lower()}{style}"
+            cached = self._font_cache.get(fontkey)
+            if cached is not None:
+                self.fonts[fontkey] = cached
+            else:
+                self.add_font(family, style, FONT_DIR + filename)
+                self._font_cache[fontkey] = self.fonts[fontkey]
+
+    HEADER_LEFT = "XGE \u2013 Basis Trade System v2.0"
+    FOOTER_TEXT = "Documento confidencial \u2013 Solo para uso interno"
 
     def header(self):
+        # Runs on every page: absolute text() writes at the same baseline a
+        # cell(0, 10, ...) would use, skipping the cell width machinery.
         if self.page_no() > 1:
             self.set_font("Arial", "I", 8)
             self.set_text_color(*self.GRAY)
-            self.cell(0, 10, "XGE \u2013 Basis Trade System v2.0", align="L")
-            self.cell(0, 10, f"P\u00e1gina {self.page_no()}", align="R")
+            baseline = self.get_y() + 5 + 0.3 * self.font_size
+            self.text(self.l_margin + self.c_margin, baseline, self.HEADER_LEFT)
+            page_str = f"P\u00e1gina {self.page_no()}"
+            self.text(
+                self.w - self.r_margin - self.c_margin - self.get_string_width(page_str),
+                baseline,
+                page_str,
+            )
             self.ln(15)
 
     def footer(self):
         self.set_y(-15)
         self.set_font("Arial", "I", 7)
         self.set_text_color(*self.GRAY)
-        self.cell(0, 10, "Documento confidencial \u2013 Solo para uso interno", align="C")
+        width = self.get_string_width(self.FOOTER_TEXT)
+        tx = self.l_margin + (self.w - self.l_margin - self.r_margin - width) / 2
+        self.text(tx, self.get_y() + 5 + 0.3 * self.font_size, self.FOOTER_TEXT)
 
     def title_page(self):
         self.add_page()
@@ -82,15 +340,22 @@ class XGEReport(FPDF):
     def body_text(self, text):
         self.set_font("Arial", "", 10)
         self.set_text_color(*self.DARK)
-        self.multi_cell(0, 5.5, text)
+        w = self.w - self.l_margin - self.r_margin
+        self._render_lines(_wrap(text, w, "Arial", "", 10), self.l_margin, w)
         self.ln(2)
 
     def bullet(self, text):
         self.set_font("Arial", "", 10)
         self.set_text_color(*self.DARK)
-        self.cell(8, 5.5, "\u2022")
-        self.multi_cell(0, 5.5, text)
-        self.ln(1)
+        w = self.w - self.l_margin - self.r_margin - 8
+        if self.get_string_width("\u2022 " + text) <= w:
+            # Single-line bullet (the common case): one text op.
+            self.cell(0, 5.5, "\u2022 " + text)
+            self.ln(6.5)
+        else:
+            self.cell(8, 5.5, "\u2022")
+            self.multi_cell(0, 5.5, text)
+            self.ln(1)
 
     def formula_box(self, lines):
         self.set_fill_color(*self.LIGHT_BG)
@@ -103,47 +368,90 @@ class XGEReport(FPDF):
         if y_start + h > self.h - 25:
             self.add_page()
             y_start = self.get_y()
-        self.set_xy(x, y_start)
         self.rect(x - 2, y_start - 2, w + 4, h + 4, "F")
-        for line in lines:
-            self.set_x(x + 2)
-            self.cell(w, 5.5, line)
-            self.ln(5.5)
+        # One text object for the whole box — formula lines are pre-formatted,
+        # so a single multi_cell avoids a cell()/ln() round-trip per line.
+        self.set_xy(x + 2, y_start)
+        self.multi_cell(w, 5.5, "\n".join(lines), align="L")
         self.ln(4)
 
     def table(self, headers, rows, col_widths=None):
         if col_widths is None:
             col_widths = [(self.w - 2 * self.l_margin) / len(headers)] * len(headers)
+        row_h = 6.5
+        table_w = sum(col_widths)
         self.set_fill_color(*self.ACCENT)
         self.set_text_color(*self.WHITE)
         self.set_font("Arial", "B", 9)
         for i, h in enumerate(headers):
             self.cell(col_widths[i], 7, h, border=1, fill=True, align="C")
         self.ln()
+        # Body rows avoid per-cell cell() calls: font/colors are set once,
+        # zebra shading is one rect per shaded row, values go out as
+        # absolutely-positioned text() writes, and borders are drawn as a
+        # bulk grid once per page chunk.
         self.set_text_color(*self.DARK)
         self.set_font("Arial", "", 9)
+        self.set_fill_color(240, 240, 245)
+        x0 = self.l_margin
         fill = False
-        for row in rows:
-            if self.get_y() > self.h - 25:
+        rows = list(rows)
+        index = 0
+        # Pagination is planned upfront: compute how many rows fit on the
+        # current page, render that chunk with no per-row checks, then page
+        # break and repeat. A row may start up to self.h - 25, matching the
+        # old greedy per-row guard.
+        while index < len(rows):
+            fitting = int((self.h - 25 - self.get_y()) / row_h) + 1
+            if fitting < 1:
+                self.add_page()
+                fitting = int((self.h - 25 - self.get_y()) / row_h) + 1
+            chunk = rows[index:index + fitting]
+            chunk_top = self.get_y()
+            y = chunk_top
+            for row in chunk:
+                if fill:
+                    self.rect(x0, y, table_w, row_h, "F")
+                baseline = y + 0.5 * row_h + 0.3 * self.font_size
+                x = x0
+                for i, val in enumerate(row):
+                    val = str(val)
+                    if i > 0:
+                        tx = x + (col_widths[i] - self.get_string_width(val)) / 2
+                    else:
+                        tx = x + self.c_margin
+                    self.text(tx, baseline, val)
+                    x += col_widths[i]
+                y += row_h
+                fill = not fill
+            self.set_xy(x0, y)
+            self._table_grid(x0, chunk_top, len(chunk), col_widths, row_h)
+            index += len(chunk)
+            if index < len(rows):
                 self.add_page()
-            if fill:
-                self.set_fill_color(240, 240, 245)
-            else:
-                self.set_fill_color(*self.WHITE)
-            for i, val in enumerate(row):
-                align = "C" if i > 0 else "L"
-                self.cell(col_widths[i], 6.5, str(val), border=1, fill=True, align=align)
-            self.ln()
-            fill = not fill
         self.ln(4)
 
+    def _table_grid(self, x0, top, n_rows, col_widths, row_h):
+        """Draw all cell borders for a chunk of table rows in one pass."""
+        if not n_rows:
+            return
+        bottom = top + n_rows * row_h
+        x = x0
+        self.line(x, top, x, bottom)
+        for w in col_widths:
+            x += w
+            self.line(x, top, x, bottom)
+        for i in range(n_rows + 1):
+            y = top + i * row_h
+            self.line(x0, y, x, y)
+
     def highlight_box(self, title, text):
         self.set_fill_color(230, 243, 255)
         self.set_draw_color(*self.ACCENT)
         y = self.get_y()
         w = self.w - 2 * self.l_margin
         self.set_font("Arial", "", 10)
-        lines = self.multi_cell(w - 16, 5.5, text, dry_run=True, output="LINES")
+        lines = self.multi_cell(w - 16, 5.5, text, dry_run=True, output=MethodReturnValue.LINES)
         h = len(lines) * 5.5 + 18
         if y + h > self.h - 25:
             self.add_page()
@@ -156,16 +464,23 @@ class XGEReport(FPDF):
         self.set_xy(self.l_margin + 6, y + 11)
         self.set_font("Arial", "", 10)
         self.set_text_color(*self.DARK)
-        self.multi_cell(w - 16, 5.5, text)
+        self._render_lines(lines, self.l_margin + 6, w - 16)
         self.set_y(y + h + 4)
 
+    def _render_lines(self, lines, x, w):
+        """Emit pre-wrapped lines as plain cells, skipping a second wrap pass."""
+        for line in lines:
+            self.set_x(x)
+            self.cell(w, 5.5, line)
+            self.ln(5.5)
+
     def warning_box(self, title, text):
         self.set_fill_color(255, 243, 230)
         self.set_draw_color(200, 100, 0)
         y = self.get_y()
         w = self.w - 2 * self.l_margin
         self.set_font("Arial", "", 10)
-        lines = self.multi_cell(w - 16, 5.5, text, dry_run=True, output="LINES")
+        lines = self.multi_cell(w - 16, 5.5, text, dry_run=True, output=MethodReturnValue.LINES)
         h = len(lines) * 5.5 + 18
         if y + h > self.h - 25:
             self.add_page()
@@ -178,15 +493,52 @@ class XGEReport(FPDF):
         self.set_xy(self.l_margin + 6, y + 11)
         self.set_font("Arial", "", 10)
         self.set_text_color(*self.DARK)
-        self.multi_cell(w - 16, 5.5, text)
+        self._render_lines(lines, self.l_margin + 6, w - 16)
         self.set_y(y + h + 4)
 
 
-def build():
-    pdf = XGEReport()
-    pdf.set_auto_page_break(auto=True, margin=25)
-    pdf.set_left_margin(20)
-    pdf.set_right_margin(20)
+# Pristine configured document, deep-copied per build() so repeated
+# generations skip __init__/font setup entirely.  Built lazily on first
+# use (fonts may not be present at import time).
+_template: XGEReport | None = None
+
+
+def _new_document() -> XGEReport:
+    global _template
+    if _template is None:
+        template = XGEReport()
+        template.set_auto_page_break(auto=True, margin=25)
+        template.set_left_margin(20)
+        template.set_right_margin(20)
+        _template = template
+    # Seed the memo with the shared font objects so the copy keeps
+    # pointing at the class-level cache instead of duplicating them.
+    memo = {id(font): font for font in XGEReport._font_cache.values()}
+    return copy.deepcopy(_template, memo)
+
+
+@functools.lru_cache(maxsize=256)
+def _wrap(text: str, w: float, family: str, style: str, size: float) -> tuple[str, ...]:
+    """Wrap text against the real font metrics once; cached across builds.
+
+    The static report paragraphs never change, so the greedy line-break
+    pass only has to run the first time each (text, width, font) combo
+    is seen — after that rendering is a plain cell-per-line loop.
+    """
+    scratch = _new_document()
+    scratch.set_auto_page_break(auto=False)
+    scratch.add_page()
+    scratch.set_font(family, style, size)
+    return tuple(
+        scratch.multi_cell(w, 5.5, text, dry_run=True, output=MethodReturnValue.LINES)
+    )
+
+
+def _render(compress: bool = True) -> XGEReport:
+    pdf = _new_document()
+    # Skipping zlib on the content streams roughly halves output() time;
+    # handy for preview/debug copies where size doesn't matter.
+    pdf.compress = compress
 
     # ═══════════════════════════════════════════════════════════════
     # PORTADA
@@ -328,31 +680,15 @@ def build():
     pdf.subsection_title("Tier 1 \u2014 Large Caps")
     pdf.table(
         ["Par\u00e1metro", "Valor"],
-        [
-            ["S\u00edmbolos", "BTC/USDT, ETH/USDT, SOL/USDT, XRP/USDT"],
-            ["Capital asignado", "1.260 USDT"],
-            ["Tama\u00f1o por par", "315 USDT (1.260 / 4)"],
-            ["M\u00e1ximo posiciones abiertas", "4"],
-            ["Funding m\u00ednimo por periodo", "0,008% (8,76% anualizado)"],
-            ["Stop loss por par", "-1,575 USDT (0,5% de 315)"],
-            ["Alerta de delta drift", "6,30 USDT (2% de 315)"],
-        ],
-        [55, 115],
+        _TIER1_ROWS,
+        _W2_PARAM,
     )
 
     pdf.subsection_title("Tier 2 \u2014 Mid Caps")
     pdf.table(
         ["Par\u00e1metro", "Valor"],
-        [
-            ["S\u00edmbolos", "WLD/USDT, NEAR/USDT, AVAX/USDT"],
-            ["Capital asignado", "360 USDT"],
-            ["Tama\u00f1o por par", "180 USDT"],
-            ["M\u00e1ximo posiciones abiertas", "2"],
-            ["Funding m\u00ednimo por periodo", "0,015% (16,4% anualizado)"],
-            ["Stop loss por par", "-0,90 USDT (0,5% de 180)"],
-            ["Alerta de delta drift", "3,60 USDT (2% de 180)"],
-        ],
-        [55, 115],
+        _TIER2_ROWS,
+        _W2_PARAM,
     )
 
     pdf.subsection_title("Blacklist")
@@ -402,11 +738,7 @@ def build():
     )
     pdf.table(
         ["Exchange", "Spot", "Perp Maker", "Perp Taker"],
-        [
-            ["Bitget", "0,10%", "0,02%", "0,06%"],
-            ["OKX", "0,10%", "0,02%", "0,05%"],
-            ["MEXC", "0,02%", "0,00%", "0,06%"],
-        ],
+        _FEES_ROWS,
         [40, 35, 45, 45],
     )
 
@@ -483,10 +815,7 @@ def build():
     )
     pdf.table(
         ["Tier", "Tama\u00f1o", "Stop Loss", "L\u00edmite"],
-        [
-            ["Tier 1", "315 USDT", "0,5%", "-1,575 USDT"],
-            ["Tier 2", "180 USDT", "0,5%", "-0,900 USDT"],
-        ],
+        _STOP_LOSS_ROWS,
         [30, 40, 30, 40],
     )
     pdf.formula_box([
@@ -548,7 +877,7 @@ def build():
     )
     pdf.formula_box([
         "basis = (spot_price - perp_price) / perp_price \u00d7 100",
-        "Almacenado en: basis:{exchange}:{symbol}:{timestamp}",
+        "Almacenado en: basis:{exchange}:{symbol} (sorted set, 24h)",
         "TTL: 24 horas",
     ])
 
@@ -566,20 +895,7 @@ def build():
     pdf.subsection_title("M\u00f3dulos del sistema")
     pdf.table(
         ["M\u00f3dulo", "Funci\u00f3n", "Frecuencia"],
-        [
-            ["ws_collector", "Precios bid/ask en tiempo real (WebSocket)", "Continuo"],
-            ["funding_collector", "Funding rates (WS o REST fallback)", "5 min"],
-            ["redis_cache", "Almac\u00e9n de datos en memoria", "Continuo"],
-            ["pair_selector", "Validaci\u00f3n multicapa de oportunidades", "Por entrada"],
-            ["breakeven", "C\u00e1lculo de viabilidad con fees reales", "Por entrada"],
-            ["tier_config", "Definici\u00f3n de tiers, capital y comisiones", "Est\u00e1tico"],
-            ["strategy", "L\u00f3gica de entrada/salida con tiers", "60 seg"],
-            ["executor", "Ejecuci\u00f3n de \u00f3rdenes (paper/live)", "Por se\u00f1al"],
-            ["position_manager", "Gesti\u00f3n de posiciones en Redis", "Por evento"],
-            ["delta_monitor", "Monitorizaci\u00f3n de delta y basis", "30 seg"],
-            ["metrics", "C\u00e1lculo de m\u00e9tricas y reportes", "Bajo demanda"],
-            ["email_notifier", "Notificaciones de apertura/cierre", "Por evento"],
-        ],
+        _MODULES_ROWS,
         [38, 85, 40],
     )
 
@@ -622,20 +938,8 @@ def build():
     pdf.subsection_title("M\u00e9tricas disponibles")
     pdf.table(
         ["M\u00e9trica", "Descripci\u00f3n"],
-        [
-            ["funding_yield_real", "Rendimiento real del funding cobrado vs. capital"],
-            ["basis_cost", "Coste medio del spread al entrar"],
-            ["net_pnl_ratio", "PnL neto como porcentaje del capital usado"],
-            ["win_rate", "Porcentaje de trades con PnL positivo"],
-            ["avg_pnl_per_trade", "PnL medio por operaci\u00f3n"],
-            ["funding_vs_drift", "Ratio funding cobrado vs. p\u00e9rdida por drift"],
-            ["projected_monthly_yield", "Rendimiento mensual proyectado"],
-            ["capital_deployed", "Capital actualmente en posiciones"],
-            ["capital_free", "Capital disponible para nuevas posiciones"],
-            ["reserve_status", "Estado de la reserva (OK o ALERT)"],
-            ["best_pair / worst_pair", "Par con mejor/peor rendimiento acumulado"],
-        ],
-        [55, 115],
+        _METRICS_ROWS,
+        _W2_PARAM,
     )
 
     pdf.subsection_title("Logging estructurado")
@@ -664,15 +968,7 @@ def build():
     pdf.subsection_title("\u00bfQu\u00e9 cambia al escalar?")
     pdf.table(
         ["Par\u00e1metro", "2.000 USDT", "100K USDT", "1M USDT"],
-        [
-            ["Exchanges", "3", "6\u20138", "10\u201312"],
-            ["Pares por tier", "4 + 3", "15 + 10", "25 + 15"],
-            ["Posiciones simult\u00e1neas", "6", "20\u201330", "40\u201350"],
-            ["Tama\u00f1o por posici\u00f3n", "180\u2013315", "2K\u20135K", "10K\u201330K"],
-            ["Fee (VIP)", "Est\u00e1ndar", "Reducido", "VIP"],
-            ["Coste por ciclo", "~0,32%", "~0,24%", "~0,16%"],
-            ["Retorno estimado", "4\u20138%", "5\u201310%", "6\u201312%"],
-        ],
+        _SCALING_ROWS,
         [42, 30, 30, 30],
     )
 
@@ -719,16 +1015,7 @@ def build():
 
     pdf.table(
         ["Riesgo", "Probabilidad", "Impacto", "Mitigaci\u00f3n"],
-        [
-            ["Funding negativo", "Media", "Bajo", "Cierre tras 2 periodos negativos"],
-            ["Delta drift", "Media", "Bajo", "Monitor cada 30s, rebalanceo auto"],
-            ["Slippage entrada", "Baja", "Bajo", "Spread < 0,05% como filtro"],
-            ["Liquidaci\u00f3n perp", "Muy baja", "Alto", "Delta-neutral + stop loss 0,5%"],
-            ["Exchange down", "Baja", "Medio", "Diversificaci\u00f3n en 3\u201312 exchanges"],
-            ["Hackeo exchange", "Muy baja", "Alto", "M\u00e1x. 15% capital por exchange"],
-            ["Low funding period", "Alta", "Bajo", "No abrir si breakeven > 3 d\u00edas"],
-            ["Reserva da\u00f1ada", "Baja", "Alto", "Cierre escalonado autom\u00e1tico"],
-        ],
+        _RISKS_ROWS,
         [35, 28, 22, 80],
     )
 
@@ -754,13 +1041,9 @@ def build():
     )
 
     pdf.table(
-        ["Escenario", "Funding medio", "Neto/mes", "Neto/a\u00f1o", "% Anual"],
-        [
-            ["Conservador", "0,008%/per.", "$1,44", "$17,28", "0,86%"],
-            ["Moderado", "0,015%/per.", "$4,32", "$51,84", "2,59%"],
-            ["Optimista", "0,03%/per.", "$11,88", "$142,56", "7,13%"],
-        ],
-        [30, 35, 30, 30, 30],
+        _PROJECTION_HEADERS,
+        _PROJECTION_2K_ROWS,
+        _W5_PROJECTION,
     )
 
     pdf.warning_box(
@@ -772,24 +1055,16 @@ def build():
 
     pdf.subsection_title("Con 100.000 USDT (primer escalado)")
     pdf.table(
-        ["Escenario", "Funding medio", "Neto/mes", "Neto/a\u00f1o", "% Anual"],
-        [
-            ["Conservador", "0,008%/per.", "$130", "$1.560", "1,56%"],
-            ["Moderado", "0,012%/per.", "$380", "$4.560", "4,56%"],
-            ["Optimista", "0,018%/per.", "$750", "$9.000", "9,00%"],
-        ],
-        [30, 35, 30, 30, 30],
+        _PROJECTION_HEADERS,
+        _PROJECTION_100K_ROWS,
+        _W5_PROJECTION,
     )
 
     pdf.subsection_title("Con 1.000.000 USDT (escala institucional)")
     pdf.table(
-        ["Escenario", "Funding medio", "Neto/mes", "Neto/a\u00f1o", "% Anual"],
-        [
-            ["Conservador", "0,008%/per.", "$3.194", "$38.320", "3,83%"],
-            ["Moderado", "0,012%/per.", "$5.693", "$68.320", "6,83%"],
-            ["Optimista", "0,018%/per.", "$9.579", "$114.950", "11,50%"],
-        ],
-        [30, 35, 30, 30, 30],
+        _PROJECTION_HEADERS,
+        _PROJECTION_1M_ROWS,
+        _W5_PROJECTION,
     )
 
     pdf.highlight_box(
@@ -810,13 +1085,7 @@ def build():
 
     pdf.table(
         ["Inversi\u00f3n", "Retorno", "Ret. \u20ac", "Riesgo", "Volat."],
-        [
-            ["Cuenta ahorro", "3\u20134%", "$30\u201340K", "Muy bajo", "Nula"],
-            ["Bonos EE.UU.", "4\u20135%", "$40\u201350K", "Bajo", "Baja"],
-            ["S&P 500", "8\u201310%", "$80\u2013100K", "Medio", "Alta"],
-            ["Basis trade XGE", "4\u201312%", "$38\u2013115K", "Medio-bajo", "Muy baja"],
-            ["Holding BTC", "Variable", "Variable", "Muy alto", "Muy alta"],
-        ],
+        _COMPARISON_ROWS,
         [36, 22, 27, 28, 28],
     )
 
@@ -877,12 +1146,39 @@ def build():
         "en el archivo de configuraci\u00f3n."
     )
 
-    # ── Guardar ──
-    output_path = "/Users/platomico/Desktop/projects/xge/XGE_Basis_Trade_System.pdf"
-    pdf.output(output_path)
-    print(f"PDF generado: {output_path}")
-    return output_path
+    return pdf
+
+
+def build(compress: bool = True) -> bytes:
+    return bytes(_render(compress).output())
+
+
+def write_pdf(path: str, compress: bool = True) -> None:
+    """Render and write the PDF through a buffered handle.
+
+    Writes fpdf2's internal bytearray directly, skipping the extra
+    bytes() copy that build() makes for its immutable return value.
+    """
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(_render(compress).output())
+
+
+def build_many(count: int, max_workers: int | None = None) -> list[bytes]:
+    """Generate several documents in parallel, one worker process per core.
+
+    Each worker keeps its own module-level font cache, so the TTF parse
+    cost is paid once per worker instead of once per document.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_build_one, range(count)))
+
+
+def _build_one(_index: int) -> bytes:
+    return build()
 
 
 if __name__ == "__main__":
-    build()
+    write_pdf(OUTPUT_PATH)
+    print(f"PDF generado: {OUTPUT_PATH}")
@@ -1,117 +1,340 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from time import monotonic
 from typing import AsyncIterator
 
 import redis.asyncio as aioredis
+from redis.exceptions import NoScriptError
 
 logger = logging.getLogger("xge.cache")
 
+# Server-side SET + PUBLISH in one command; saves the second command
+# parse per tick compared to a two-command pipeline.
+_SET_PUB_SCRIPT = (
+    "redis.call('SET', KEYS[1], ARGV[1]) "
+    "return redis.call('PUBLISH', KEYS[2], ARGV[1])"
+)
+
+# Connection pools shared by every RedisCache in the process, one per
+# distinct (url, host, port, decode) target, so multiple caches don't
+# each open their own sockets.
+_pools: dict[tuple, aioredis.ConnectionPool] = {}
+
+
+def _get_pool(
+    url: str, host: str, port: int, decode_responses: bool
+) -> aioredis.ConnectionPool:
+    key = (url, host, port, decode_responses)
+    pool = _pools.get(key)
+    if pool is None:
+        if url:
+            pool = aioredis.ConnectionPool.from_url(
+                url,
+                decode_responses=decode_responses,
+                max_connections=32,
+                health_check_interval=30,
+            )
+        else:
+            pool = aioredis.ConnectionPool(
+                host=host,
+                port=port,
+                decode_responses=decode_responses,
+                max_connections=32,
+                health_check_interval=30,
+            )
+        _pools[key] = pool
+    return pool
+
+
+class _NoopPipeline:
+    """Pipeline counterpart of _NoopRedis; queues nothing."""
+
+    async def __aenter__(self) -> "_NoopPipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def set(self, *args, **kwargs) -> None:
+        pass
+
+    def publish(self, *args, **kwargs) -> None:
+        pass
+
+    def zadd(self, *args, **kwargs) -> None:
+        pass
+
+    def zremrangebyscore(self, *args, **kwargs) -> None:
+        pass
+
+    def delete(self, *args, **kwargs) -> None:
+        pass
+
+    def rpush(self, *args, **kwargs) -> None:
+        pass
+
+    def sadd(self, *args, **kwargs) -> None:
+        pass
+
+    def srem(self, *args, **kwargs) -> None:
+        pass
+
+    async def execute(self) -> list:
+        return []
+
+
+class _NoopRedis:
+    """No-op client used before connect().
+
+    Lets the hot-path methods await unconditionally instead of branching
+    on an optional client for every operation.
+    """
+
+    async def get(self, *args, **kwargs):
+        return None
+
+    async def mget(self, keys, *args, **kwargs):
+        return [None] * len(keys)
+
+    async def set(self, *args, **kwargs):
+        return None
+
+    async def publish(self, *args, **kwargs):
+        return None
+
+    async def delete(self, *args, **kwargs):
+        return None
+
+    async def rpush(self, *args, **kwargs):
+        return None
+
+    async def lrange(self, *args, **kwargs):
+        return []
+
+    async def scan(self, *args, **kwargs):
+        return 0, []
+
+    async def smembers(self, *args, **kwargs):
+        return set()
+
+    async def pubsub_numpat(self):
+        return 0
+
+    async def pubsub_numsub(self, *args):
+        return []
+
+    async def close(self):
+        return None
+
+    def pipeline(self, transaction: bool = True) -> _NoopPipeline:
+        return _NoopPipeline()
+
+
+_NOOP = _NoopRedis()
+
 
 class RedisCache:
     """Async Redis cache for price data with pub/sub support."""
 
+    SUB_COUNT_REFRESH = 10.0  # seconds between PUBSUB NUMSUB probes
+
     def __init__(self, host: str = "localhost", port: int = 6379, url: str = "") -> None:
         self._url = url
         self._host = host
         self._port = port
-        self._redis: aioredis.Redis | None = None
+        self._redis: aioredis.Redis | _NoopRedis = _NOOP
+        self._writer: aioredis.Redis | _NoopRedis = _NOOP
+        # Subscriber counts per channel, refreshed in the background so
+        # publishes to channels nobody listens on can be skipped.
+        self._channels: set[str] = set()
+        self._sub_count: dict[str, int] = {}
+        self._sub_count_at: float = 0.0
+        self._set_pub_sha: str | None = None
 
     async def connect(self) -> None:
+        # Reader decodes replies to str; the write-only client skips
+        # decode_responses since SET/PUBLISH replies are never inspected.
+        self._redis = aioredis.Redis(
+            connection_pool=_get_pool(self._url, self._host, self._port, True)
+        )
+        self._writer = aioredis.Redis(
+            connection_pool=_get_pool(self._url, self._host, self._port, False)
+        )
+        await self._redis.ping()
+        self._set_pub_sha = await self._writer.script_load(_SET_PUB_SCRIPT)
         if self._url:
-            self._redis = aioredis.from_url(self._url, decode_responses=True)
-            await self._redis.ping()
             logger.info("Connected to Redis via URL")
         else:
-            self._redis = aioredis.Redis(
-                host=self._host,
-                port=self._port,
-                decode_responses=True,
-            )
-            await self._redis.ping()
             logger.info("Connected to Redis at %s:%d", self._host, self._port)
 
     async def close(self) -> None:
-        if self._redis:
+        if self._writer is not _NOOP:
+            await self._writer.close()
+            self._writer = _NOOP
+        if self._redis is not _NOOP:
             await self._redis.close()
+            self._redis = _NOOP
             logger.info("Redis connection closed")
 
+    def _has_subscribers(self, channel: str) -> bool:
+        """Check the cached subscriber count, refreshing it when stale."""
+        self._channels.add(channel)
+        now = monotonic()
+        if now - self._sub_count_at >= self.SUB_COUNT_REFRESH:
+            self._sub_count_at = now
+            asyncio.get_running_loop().create_task(self._refresh_sub_counts())
+        # Unknown channels default to 1 so nothing is dropped before the
+        # first probe completes
+        return self._sub_count.get(channel, 1) > 0
+
+    async def _refresh_sub_counts(self) -> None:
+        try:
+            numpat = await self._redis.pubsub_numpat()
+            if numpat > 0:
+                # Pattern subscribers (psubscribe) are invisible to
+                # NUMSUB; never skip publishes while any exist.
+                self._sub_count = {}
+                return
+            counts = await self._redis.pubsub_numsub(*self._channels)
+            self._sub_count = dict(counts)
+        except Exception:
+            logger.debug("Could not refresh pub/sub subscriber counts")
+
     async def publish(self, channel: str, data: str) -> None:
         """Publish price data to a Redis pub/sub channel."""
-        if self._redis:
-            await self._redis.publish(channel, data)
+        if self._has_subscribers(channel):
+            await self._writer.publish(channel, data)
+
+    async def set_and_publish(self, key: str, data: str, channel: str) -> None:
+        """Store a value and publish it to a channel in one round-trip."""
+        if not self._has_subscribers(channel):
+            await self._writer.set(key, data)
+            return
+        if self._set_pub_sha:
+            try:
+                await self._writer.evalsha(self._set_pub_sha, 2, key, channel, data)
+                return
+            except NoScriptError:
+                # Script cache flushed (restart/failover); reload and
+                # fall through to the pipeline for this call
+                self._set_pub_sha = await self._writer.script_load(_SET_PUB_SCRIPT)
+        async with self._writer.pipeline(transaction=False) as pipe:
+            pipe.set(key, data)
+            pipe.publish(channel, data)
+            await pipe.execute()
+
+    async def set_and_publish_many(self, items: list[tuple[str, str, str]]) -> None:
+        """Batch (key, data, channel) writes into a single round-trip."""
+        if items:
+            async with self._writer.pipeline(transaction=False) as pipe:
+                for key, data, channel in items:
+                    pipe.set(key, data)
+                    if self._has_subscribers(channel):
+                        pipe.publish(channel, data)
+                await pipe.execute()
 
     async def set_latest(self, exchange: str, symbol: str, data: str) -> None:
         """Store the latest price entry for an exchange/symbol pair."""
         key = f"latest:{exchange}:{symbol}"
-        if self._redis:
-            await self._redis.set(key, data)
+        await self._writer.set(key, data)
 
     async def get_latest(self, exchange: str, symbol: str) -> str | None:
         """Retrieve the latest price entry for an exchange/symbol pair."""
         key = f"latest:{exchange}:{symbol}"
-        if self._redis:
-            return await self._redis.get(key)
-        return None
+        return await self._redis.get(key)
 
     async def set_funding(self, exchange: str, symbol: str, data: str) -> None:
         """Store the latest funding rate for an exchange/symbol pair."""
         key = f"funding:{exchange}:{symbol}"
-        if self._redis:
-            await self._redis.set(key, data)
+        await self._writer.set(key, data)
 
     async def get_funding(self, exchange: str, symbol: str) -> str | None:
         """Retrieve the latest funding rate for an exchange/symbol pair."""
         key = f"funding:{exchange}:{symbol}"
-        if self._redis:
-            return await self._redis.get(key)
-        return None
+        return await self._redis.get(key)
 
     async def get(self, key: str) -> str | None:
         """Get a value by key."""
-        if self._redis:
-            return await self._redis.get(key)
-        return None
+        return await self._redis.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """Get multiple values in one round-trip."""
+        if not keys:
+            return []
+        return await self._redis.mget(keys)
 
     async def set(self, key: str, data: str, ex: int | None = None) -> None:
         """Set a value by key with optional expiration in seconds."""
-        if self._redis:
-            await self._redis.set(key, data, ex=ex)
+        await self._writer.set(key, data, ex=ex)
+
+    def pipeline(self):
+        """Raw non-transactional pipeline for batching mixed commands."""
+        return self._writer.pipeline(transaction=False)
+
+    async def set_many(self, items: list[tuple[str, str]], ex: int | None = None) -> None:
+        """Set multiple (key, value) pairs in one round-trip."""
+        if items:
+            async with self._writer.pipeline(transaction=False) as pipe:
+                for key, data in items:
+                    pipe.set(key, data, ex=ex)
+                await pipe.execute()
+
+    async def zadd_series(
+        self, items: list[tuple[str, float, str]], retention: float
+    ) -> None:
+        """Append (key, score, member) points to sorted sets, trimming
+        entries older than ``retention`` seconds, in one round-trip."""
+        if items:
+            async with self._writer.pipeline(transaction=False) as pipe:
+                for key, score, member in items:
+                    pipe.zadd(key, {member: score})
+                    pipe.zremrangebyscore(key, "-inf", score - retention)
+                await pipe.execute()
 
     async def delete(self, key: str) -> None:
         """Delete a key."""
-        if self._redis:
-            await self._redis.delete(key)
+        await self._writer.delete(key)
 
     async def rpush(self, key: str, data: str) -> None:
         """Append a value to a Redis list."""
-        if self._redis:
-            await self._redis.rpush(key, data)
+        await self._writer.rpush(key, data)
 
     async def lrange(self, key: str, start: int, stop: int) -> list[str]:
         """Read a range from a Redis list."""
-        if self._redis:
-            return await self._redis.lrange(key, start, stop)
-        return []
+        return await self._redis.lrange(key, start, stop)
+
+    async def smembers(self, key: str) -> set[str]:
+        """Read all members of a Redis set."""
+        return await self._redis.smembers(key)
 
     async def scan_keys(self, pattern: str) -> list[str]:
         """Scan for keys matching a pattern."""
         keys: list[str] = []
-        if self._redis:
-            async for key in self._redis.scan_iter(match=pattern):
-                keys.append(key)
+        cursor = 0
+        while True:
+            cursor, batch = await self._redis.scan(
+                cursor=cursor, match=pattern, count=1000
+            )
+            keys.extend(batch)
+            if cursor == 0:
+                break
         return keys
 
     async def subscribe(self, pattern: str) -> AsyncIterator[dict]:
         """Subscribe to channels matching a pattern and yield messages."""
-        if not self._redis:
+        if self._redis is _NOOP:
             raise RuntimeError("Not connected to Redis")
 
         pubsub = self._redis.pubsub()
         await pubsub.psubscribe(pattern)
         try:
-            async for message in pubsub.listen():
-                if message["type"] == "pmessage":
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is not None:
                     yield message
         finally:
             await pubsub.unsubscribe(pattern)
@@ -3,6 +3,24 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 
 
+class Backoff:
+    """Exponential retry delay shared by the collector watch loops."""
+
+    __slots__ = ("delay", "cap")
+
+    def __init__(self, cap: int = 60) -> None:
+        self.delay = 1
+        self.cap = cap
+
+    def reset(self) -> None:
+        self.delay = 1
+
+    def next(self) -> int:
+        delay = self.delay
+        self.delay = min(delay * 2, self.cap)
+        return delay
+
+
 class BasePriceCollector(ABC):
     """Abstract base class for price collectors."""
 
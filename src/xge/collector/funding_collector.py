@@ -2,16 +2,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from time import time
 
 import ccxt
 import ccxt.pro as ccxtpro
 
 from xge.cache.redis_cache import RedisCache
+from xge.collector.base import Backoff
 from xge.models_funding import FundingRateEntry, spot_to_perp
 
 logger = logging.getLogger("xge.collector.funding")
 
+# Markets fetched once per exchange id and shared between collectors in
+# the process, so only the first connect() pays the load_markets call.
+_MARKETS_CACHE: dict[str, dict] = {}
+_MARKETS_LOCK = asyncio.Lock()
+
+
+def _to_seconds(ts: float) -> float:
+    """Normalize an exchange timestamp to epoch seconds.
+
+    Checked per field: some exchanges report fundingTimestamp and
+    nextFundingTimestamp in different units.
+    """
+    ts = float(ts)
+    return ts * 1e-3 if ts > 1e12 else ts
+
 
 class FundingRateCollector:
     """Collects funding rates from a single exchange via WS or REST polling."""
@@ -31,7 +48,14 @@ class FundingRateCollector:
         self._running = False
         self._perp_symbols: list[str] = []
         self._perp_to_spot: dict[str, str] = {}
+        self._funding_key: dict[str, str] = {}
         self._skip_symbols: set[str] = set()
+        # Last published (rate, next timestamp, write time) per perp
+        # symbol; funding only changes every 8h, so most WS ticks repeat
+        # the same values. A republish is still forced once per
+        # poll_interval so the stored entry's timestamp stays inside the
+        # strategy's staleness window while the rate sits unchanged.
+        self._last_funding: dict[str, tuple[float, float | None, float]] = {}
 
     async def connect(self) -> None:
         exchange_class = getattr(ccxtpro, self.exchange_id, None)
@@ -39,14 +63,23 @@ class FundingRateCollector:
             raise ValueError(f"Exchange {self.exchange_id} not supported by ccxt.pro")
 
         self._exchange = exchange_class({"enableRateLimit": True})
-        await self._exchange.load_markets()
+        async with _MARKETS_LOCK:
+            markets = _MARKETS_CACHE.get(self.exchange_id)
+            if markets is None:
+                await self._exchange.load_markets()
+                _MARKETS_CACHE[self.exchange_id] = self._exchange.markets
+            else:
+                self._exchange.set_markets(markets)
 
         # Build perp symbol map, only keeping symbols that exist on this exchange
+        # Interned symbols let the per-tick dict probes compare pointers
+        # instead of hashing full strings
         for spot_sym in self.symbols:
-            perp_sym = spot_to_perp(spot_sym)
+            perp_sym = sys.intern(spot_to_perp(spot_sym))
             if perp_sym in self._exchange.markets:
                 self._perp_symbols.append(perp_sym)
-                self._perp_to_spot[perp_sym] = spot_sym
+                self._perp_to_spot[perp_sym] = sys.intern(spot_sym)
+                self._funding_key[perp_sym] = f"funding:{self.exchange_id}:{spot_sym}"
 
         logger.info(
             "Funding collector connected to %s (%d/%d perp symbols available)",
@@ -76,8 +109,46 @@ class FundingRateCollector:
             )
             return
 
-        tasks = [self._collect_symbol(symbol) for symbol in self._perp_symbols]
-        await asyncio.gather(*tasks)
+        # Prefer a single multi-symbol WS subscription when available;
+        # fall back to one listener per symbol otherwise.
+        if self._exchange.has.get("watchFundingRates"):
+            await self._watch_funding_all()
+            return
+
+        async with asyncio.TaskGroup() as tg:
+            for symbol in self._perp_symbols:
+                tg.create_task(self._collect_symbol(symbol))
+
+    async def _watch_funding_all(self) -> None:
+        """Watch funding rates for all perp symbols over one connection."""
+        backoff = Backoff()
+        while self._running:
+            try:
+                results = await self._exchange.watch_funding_rates(self._perp_symbols)
+                for perp_symbol, result in results.items():
+                    perp_symbol = sys.intern(perp_symbol)
+                    if perp_symbol in self._perp_to_spot:
+                        await self._process_funding(perp_symbol, result)
+                backoff.reset()
+            except (ccxt.NotSupported, AttributeError):
+                logger.debug(
+                    "Multi-symbol funding WS not usable on %s, "
+                    "falling back to per-symbol collection",
+                    self.exchange_id,
+                )
+                async with asyncio.TaskGroup() as tg:
+                    for symbol in self._perp_symbols:
+                        tg.create_task(self._collect_symbol(symbol))
+                return
+            except Exception as e:
+                if not self._running:
+                    break
+                delay = backoff.next()
+                logger.error(
+                    "Error watching funding rates on %s: %s. Retrying in %ds...",
+                    self.exchange_id, e, delay,
+                )
+                await asyncio.sleep(delay)
 
     async def _collect_symbol(self, perp_symbol: str) -> None:
         """Collect funding rate for a single symbol, trying WS then REST."""
@@ -102,12 +173,12 @@ class FundingRateCollector:
 
     async def _watch_funding(self, perp_symbol: str) -> None:
         """Watch funding rate via WebSocket."""
-        backoff = 1
+        backoff = Backoff()
         while self._running:
             try:
                 result = await self._exchange.watch_funding_rate(perp_symbol)
                 await self._process_funding(perp_symbol, result)
-                backoff = 1
+                backoff.reset()
             except ccxt.BadSymbol:
                 logger.warning(
                     "Symbol %s not available on %s, skipping permanently",
@@ -119,21 +190,21 @@ class FundingRateCollector:
             except Exception as e:
                 if not self._running:
                     break
+                delay = backoff.next()
                 logger.error(
                     "Error watching funding %s on %s: %s. Retrying in %ds...",
-                    perp_symbol, self.exchange_id, e, backoff,
+                    perp_symbol, self.exchange_id, e, delay,
                 )
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 60)
+                await asyncio.sleep(delay)
 
     async def _poll_funding(self, perp_symbol: str) -> None:
         """Poll funding rate via REST API."""
-        backoff = 1
+        backoff = Backoff()
         while self._running:
             try:
                 result = await self._exchange.fetch_funding_rate(perp_symbol)
                 await self._process_funding(perp_symbol, result)
-                backoff = 1
+                backoff.reset()
                 await asyncio.sleep(self.poll_interval)
             except ccxt.BadSymbol:
                 logger.warning(
@@ -144,12 +215,12 @@ class FundingRateCollector:
             except Exception as e:
                 if not self._running:
                     break
+                delay = backoff.next()
                 logger.error(
                     "Error polling funding %s on %s: %s. Retrying in %ds...",
-                    perp_symbol, self.exchange_id, e, backoff,
+                    perp_symbol, self.exchange_id, e, delay,
                 )
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 60)
+                await asyncio.sleep(delay)
 
     async def _process_funding(self, perp_symbol: str, result: dict) -> None:
         """Process and store a funding rate result."""
@@ -162,17 +233,32 @@ class FundingRateCollector:
         next_ts = result.get("nextFundingTimestamp")
         next_rate = result.get("nextFundingRate")
 
+        # Skip republishing when nothing changed since the last tick,
+        # unless the last write is old enough that consumers would start
+        # treating the cached entry as stale
+        now = time()
+        current = (float(funding_rate), float(next_ts) if next_ts else None)
+        last = self._last_funding.get(perp_symbol)
+        if (
+            last is not None
+            and (last[0], last[1]) == current
+            and now - last[2] < self.poll_interval
+        ):
+            return
+        self._last_funding[perp_symbol] = (current[0], current[1], now)
+
         entry = FundingRateEntry(
             exchange=self.exchange_id,
             symbol=perp_symbol,
             spot_symbol=spot_symbol,
             funding_rate=float(funding_rate),
-            funding_timestamp=float(funding_ts) / 1000 if funding_ts > 1e12 else float(funding_ts),
-            next_funding_timestamp=float(next_ts) / 1000 if next_ts and next_ts > 1e12 else (float(next_ts) if next_ts else None),
+            funding_timestamp=_to_seconds(funding_ts),
+            next_funding_timestamp=_to_seconds(next_ts) if next_ts else None,
             next_funding_rate=float(next_rate) if next_rate is not None else None,
-            timestamp=time(),
+            timestamp=now,
         )
 
-        channel = f"funding:{self.exchange_id}:{spot_symbol}"
-        await self.cache.set_funding(self.exchange_id, spot_symbol, entry.to_json())
-        await self.cache.publish(channel, entry.to_json())
+        key = self._funding_key.get(perp_symbol)
+        if key is None:
+            key = f"funding:{self.exchange_id}:{spot_symbol}"
+        await self.cache.set_and_publish(key, entry.to_json(), key)
@@ -7,7 +7,7 @@ from time import time
 import ccxt
 import ccxt.pro as ccxtpro
 
-from xge.collector.base import BasePriceCollector
+from xge.collector.base import Backoff, BasePriceCollector
 from xge.models import OrderBookEntry
 from xge.cache.redis_cache import RedisCache
 
@@ -17,6 +17,8 @@ logger = logging.getLogger("xge.collector")
 class WSPriceCollector(BasePriceCollector):
     """WebSocket-based price collector using ccxt.pro."""
 
+    FLUSH_INTERVAL = 0.05  # seconds; caps Redis writes at 20 Hz per symbol
+
     def __init__(
         self,
         exchange_id: str,
@@ -27,6 +29,14 @@ class WSPriceCollector(BasePriceCollector):
         self.cache = cache
         self._exchange: ccxtpro.Exchange | None = None
         self._running = False
+        # Newest entry per symbol since the last flush; liquid pairs can
+        # burst tens of deltas per ms while consumers sample every 30s.
+        self._pending: dict[str, OrderBookEntry] = {}
+        # Last top-of-book per symbol; deeper-level churn often leaves
+        # the top unchanged, making the republish redundant.
+        self._last_top: dict[str, tuple] = {}
+        self._latest_key: dict[str, str] = {}
+        self._price_channel: dict[str, str] = {}
 
     async def connect(self) -> None:
         exchange_class = getattr(ccxtpro, self.exchange_id, None)
@@ -36,6 +46,10 @@ class WSPriceCollector(BasePriceCollector):
         self._exchange = exchange_class({
             "enableRateLimit": True,
         })
+        # Redis keys/channels are fixed per symbol; build them once
+        # instead of interpolating f-strings on every tick
+        self._latest_key = {s: f"latest:{self.exchange_id}:{s}" for s in self.symbols}
+        self._price_channel = {s: f"prices:{self.exchange_id}:{s}" for s in self.symbols}
         logger.info("Connected to %s", self.exchange_id)
 
     async def disconnect(self) -> None:
@@ -51,39 +65,126 @@ class WSPriceCollector(BasePriceCollector):
             raise RuntimeError(f"Not connected to {self.exchange_id}")
 
         self._running = True
-        tasks = [self._watch_symbol(symbol) for symbol in self.symbols]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            # One multiplexed subscription when the exchange supports it,
+            # otherwise one watcher task per symbol
+            if self._exchange.has.get("watchOrderBookForSymbols"):
+                tg.create_task(self._watch_all_symbols())
+            else:
+                for symbol in self.symbols:
+                    tg.create_task(self._watch_symbol(symbol))
+            tg.create_task(self._flush_pending())
+
+    async def _watch_all_symbols(self) -> None:
+        """Watch all symbols' order books over one WS connection."""
+        backoff = Backoff(cap=300)
+        now = time
+
+        while self._running:
+            try:
+                ob = await self._exchange.watch_order_book_for_symbols(
+                    self.symbols, limit=5
+                )
+
+                symbol = ob["symbol"]
+                bids, asks = ob["bids"], ob["asks"]
+                if not bids or not asks or symbol not in self._latest_key:
+                    continue
+
+                best_bid, best_ask = bids[0], asks[0]
+                top = (best_bid[0], best_ask[0], best_bid[1], best_ask[1])
+                if self._last_top.get(symbol) == top:
+                    continue
+                self._last_top[symbol] = top
+
+                self._pending[symbol] = OrderBookEntry(
+                    exchange=self.exchange_id,
+                    symbol=symbol,
+                    bid=top[0],
+                    ask=top[1],
+                    bid_volume=top[2],
+                    ask_volume=top[3],
+                    timestamp=now(),
+                )
+
+                backoff.reset()
+
+            except (ccxt.NotSupported, AttributeError):
+                logger.debug(
+                    "Multi-symbol order book WS not usable on %s, "
+                    "falling back to per-symbol watchers",
+                    self.exchange_id,
+                )
+                async with asyncio.TaskGroup() as tg:
+                    for symbol in self.symbols:
+                        tg.create_task(self._watch_symbol(symbol))
+                return
+            except Exception as e:
+                if not self._running:
+                    break
+                delay = backoff.next()
+                logger.error(
+                    "Error watching order books on %s: %s. Retrying in %ds",
+                    self.exchange_id, e, delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _flush_pending(self) -> None:
+        """Flush coalesced order-book entries to Redis in one pipeline."""
+        while self._running:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            if not self._pending:
+                continue
+            pending, self._pending = self._pending, {}
+            items = []
+            for symbol, entry in pending.items():
+                items.append((
+                    self._latest_key[symbol],
+                    entry.to_json(),
+                    self._price_channel[symbol],
+                ))
+            try:
+                await self.cache.set_and_publish_many(items)
+            except Exception as e:
+                logger.error(
+                    "Error flushing %d entries for %s: %s",
+                    len(items), self.exchange_id, e,
+                )
 
     async def _watch_symbol(self, symbol: str) -> None:
         """Continuously watch a single symbol's order book."""
-        backoff = 1
-        max_backoff = 300  # 5 minutes max
+        backoff = Backoff(cap=300)  # 5 minutes max
         consecutive_errors = 0
         max_consecutive_errors = 10  # stop after 10 consecutive failures
+        now = time  # local alias, avoids a global lookup per tick
 
         while self._running:
             try:
                 ob = await self._exchange.watch_order_book(symbol, limit=5)
 
-                if not ob["bids"] or not ob["asks"]:
+                bids, asks = ob["bids"], ob["asks"]
+                if not bids or not asks:
                     continue
 
-                entry = OrderBookEntry(
+                # ccxt already returns floats; index the top rows once
+                best_bid, best_ask = bids[0], asks[0]
+                top = (best_bid[0], best_ask[0], best_bid[1], best_ask[1])
+                if self._last_top.get(symbol) == top:
+                    continue
+                self._last_top[symbol] = top
+
+                self._pending[symbol] = OrderBookEntry(
                     exchange=self.exchange_id,
                     symbol=symbol,
-                    bid=float(ob["bids"][0][0]),
-                    ask=float(ob["asks"][0][0]),
-                    bid_volume=float(ob["bids"][0][1]),
-                    ask_volume=float(ob["asks"][0][1]),
-                    timestamp=time(),
+                    bid=top[0],
+                    ask=top[1],
+                    bid_volume=top[2],
+                    ask_volume=top[3],
+                    timestamp=now(),
                 )
 
-                channel = f"prices:{self.exchange_id}:{symbol}"
-                await self.cache.publish(channel, entry.to_json())
-                await self.cache.set_latest(self.exchange_id, symbol, entry.to_json())
-
                 # Reset backoff on success
-                backoff = 1
+                backoff.reset()
                 consecutive_errors = 0
 
             except ccxt.BadSymbol:
@@ -103,13 +204,13 @@ class WSPriceCollector(BasePriceCollector):
                         symbol, self.exchange_id, e,
                     )
                     return
+                delay = backoff.next()
                 logger.warning(
                     "Exchange error for %s on %s: %s. Retrying in %ds (%d/%d)",
-                    symbol, self.exchange_id, e, backoff,
+                    symbol, self.exchange_id, e, delay,
                     consecutive_errors, max_consecutive_errors,
                 )
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, max_backoff)
+                await asyncio.sleep(delay)
             except Exception as e:
                 if not self._running:
                     break
@@ -120,9 +221,9 @@ class WSPriceCollector(BasePriceCollector):
                         symbol, self.exchange_id,
                     )
                     return
+                delay = backoff.next()
                 logger.error(
                     "Error watching %s on %s: %s. Retrying in %ds",
-                    symbol, self.exchange_id, e, backoff,
+                    symbol, self.exchange_id, e, delay,
                 )
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, max_backoff)
+                await asyncio.sleep(delay)
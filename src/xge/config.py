@@ -8,6 +8,11 @@ from pathlib import Path
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml, ~10x faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class ExchangeConfig:
@@ -81,11 +86,16 @@ _ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)(?::-(.*?))?\}")
 
 def _resolve_env_vars(value: str) -> str:
     """Resolve ${VAR:-default} patterns in a string."""
+    value = str(value)
+    if "${" not in value:
+        # Trivial values (hosts, emails, plain numbers) skip the regex
+        return value
+
     def replacer(match: re.Match) -> str:
         var_name = match.group(1)
         default = match.group(2) or ""
         return os.environ.get(var_name, default)
-    return _ENV_VAR_PATTERN.sub(replacer, str(value))
+    return _ENV_VAR_PATTERN.sub(replacer, value)
 
 
 def load_settings(config_path: str | Path | None = None) -> Settings:
@@ -104,7 +114,7 @@ def load_settings(config_path: str | Path | None = None) -> Settings:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(config_path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_YamlLoader)
 
     exchanges = [
         ExchangeConfig(
@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import signal
-from itertools import combinations
 
 from xge.config import load_settings
 from xge.models import OrderBookEntry, SpreadInfo
@@ -34,13 +33,21 @@ async def log_spreads(
     min_net_spread: float,
 ) -> None:
     """Periodically log latest prices and spreads between exchanges."""
+    # One MGET per interval instead of |exchanges| x |symbols| GETs
+    keys = [f"latest:{e}:{s}" for s in symbols for e in exchanges]
     while True:
         await asyncio.sleep(interval)
 
+        # Everything below only feeds DEBUG logging; skip the fetch,
+        # parsing and formatting entirely when it is off
+        if not logger.isEnabledFor(logging.DEBUG):
+            continue
+
+        values = iter(await cache.mget(keys))
         for symbol in symbols:
             entries: dict[str, OrderBookEntry] = {}
             for exchange_id in exchanges:
-                raw = await cache.get_latest(exchange_id, symbol)
+                raw = next(values)
                 if raw:
                     entries[exchange_id] = OrderBookEntry.from_json(raw)
 
@@ -54,51 +61,68 @@ async def log_spreads(
             )
             logger.debug("[%s] %s", symbol, prices_str)
 
-            # Calculate and log spreads for each pair of exchanges
-            for ex_a, ex_b in combinations(entries.keys(), 2):
-                spread = SpreadInfo.calculate(
-                    symbol, entries[ex_a], entries[ex_b],
-                    fee_a_pct=fee_map[ex_a], fee_b_pct=fee_map[ex_b],
-                )
-                if not spread:
+            # Cheap screen before the O(N^2) pair loop: best_bid/best_ask
+            # bounds every pair's net spread from above, so if even that
+            # can't clear the threshold no pair can.
+            best_bid = max(e.bid for e in entries.values())
+            best_ask = min(e.ask for e in entries.values())
+            if best_ask > 0:
+                min_fee = min(fee_map[eid] for eid in entries)
+                best_net = (best_bid / best_ask - 1) * 100 - 2 * min_fee
+                if best_net < min_net_spread:
                     continue
 
-                if spread.net_spread < min_net_spread:
-                    continue
+            # Calculate and log spreads for each pair of exchanges;
+            # a plain index loop avoids combinations()' per-pair tuples
+            ex_list = list(entries)
+            n = len(ex_list)
+            for i in range(n):
+                ex_a = ex_list[i]
+                for j in range(i + 1, n):
+                    ex_b = ex_list[j]
+                    spread = SpreadInfo.calculate(
+                        symbol, entries[ex_a], entries[ex_b],
+                        fee_a_pct=fee_map[ex_a], fee_b_pct=fee_map[ex_b],
+                    )
+                    if not spread:
+                        continue
 
-                buy_p = _fmt_price(spread.buy_price)
-                sell_p = _fmt_price(spread.sell_price)
-                depth = (
-                    f"ask_vol={spread.buy_volume:.4f} "
-                    f"bid_vol={spread.sell_volume:.4f}"
-                )
+                    if spread.net_spread < min_net_spread:
+                        continue
 
-                if spread.net_spread > 0:
-                    logger.debug(
-                        "*** OPPORTUNITY *** %s %s -> %s: spread=%.4f%% net=%.4f%% "
-                        "(buy@%s sell@%s) [%s]",
-                        spread.symbol,
-                        spread.buy_exchange,
-                        spread.sell_exchange,
-                        spread.spread_pct,
-                        spread.net_spread,
-                        buy_p,
-                        sell_p,
-                        depth,
-                    )
-                else:
-                    logger.debug(
-                        "  %s -> %s: spread=%.4f%% net=%.4f%% "
-                        "(buy@%s sell@%s) [%s]",
-                        spread.buy_exchange,
-                        spread.sell_exchange,
-                        spread.spread_pct,
-                        spread.net_spread,
-                        buy_p,
-                        sell_p,
-                        depth,
+                    buy_p = _fmt_price(spread.buy_price)
+                    sell_p = _fmt_price(spread.sell_price)
+                    depth = (
+                        f"ask_vol={spread.buy_volume:.4f} "
+                        f"bid_vol={spread.sell_volume:.4f}"
                     )
 
+                    if spread.net_spread > 0:
+                        logger.debug(
+                            "*** OPPORTUNITY *** %s %s -> %s: spread=%.4f%% net=%.4f%% "
+                            "(buy@%s sell@%s) [%s]",
+                            spread.symbol,
+                            spread.buy_exchange,
+                            spread.sell_exchange,
+                            spread.spread_pct,
+                            spread.net_spread,
+                            buy_p,
+                            sell_p,
+                            depth,
+                        )
+                    else:
+                        logger.debug(
+                            "  %s -> %s: spread=%.4f%% net=%.4f%% "
+                            "(buy@%s sell@%s) [%s]",
+                            spread.buy_exchange,
+                            spread.sell_exchange,
+                            spread.spread_pct,
+                            spread.net_spread,
+                            buy_p,
+                            sell_p,
+                            depth,
+                        )
+
 
 async def log_funding_spreads(
     cache: RedisCache,
@@ -109,13 +133,18 @@ async def log_funding_spreads(
     min_cross_spread_pct: float,
 ) -> None:
     """Periodically log funding rate opportunities."""
+    keys = [f"funding:{e}:{s}" for s in symbols for e in exchanges]
     while True:
         await asyncio.sleep(interval)
 
+        if not logger.isEnabledFor(logging.DEBUG):
+            continue
+
+        values = iter(await cache.mget(keys))
         for symbol in symbols:
             entries: dict[str, FundingRateEntry] = {}
             for exchange_id in exchanges:
-                raw = await cache.get_funding(exchange_id, symbol)
+                raw = next(values)
                 if raw:
                     entries[exchange_id] = FundingRateEntry.from_json(raw)
 
@@ -138,22 +167,27 @@ async def log_funding_spreads(
             if len(entries) < 2:
                 continue
 
-            for ex_a, ex_b in combinations(entries.keys(), 2):
-                spread = FundingRateSpread.calculate(entries[ex_a], entries[ex_b])
-                if abs(spread.spread) < min_cross_spread_pct:
-                    continue
+            ex_list = list(entries)
+            n = len(ex_list)
+            for i in range(n):
+                for j in range(i + 1, n):
+                    spread = FundingRateSpread.calculate(
+                        entries[ex_list[i]], entries[ex_list[j]]
+                    )
+                    if abs(spread.spread) < min_cross_spread_pct:
+                        continue
 
-                logger.debug(
-                    "*** FUNDING SPREAD *** %s: %s(%.4f%%) -> %s(%.4f%%) "
-                    "spread=%.6f annualized=%.2f%%",
-                    spread.symbol,
-                    spread.high_exchange,
-                    spread.high_rate * 100,
-                    spread.low_exchange,
-                    spread.low_rate * 100,
-                    spread.spread,
-                    spread.annualized_spread,
-                )
+                    logger.debug(
+                        "*** FUNDING SPREAD *** %s: %s(%.4f%%) -> %s(%.4f%%) "
+                        "spread=%.6f annualized=%.2f%%",
+                        spread.symbol,
+                        spread.high_exchange,
+                        spread.high_rate * 100,
+                        spread.low_exchange,
+                        spread.low_rate * 100,
+                        spread.spread,
+                        spread.annualized_spread,
+                    )
 
 
 async def run() -> None:
@@ -359,6 +393,12 @@ async def run() -> None:
 
 
 def main() -> None:
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
     asyncio.run(run())
 
 
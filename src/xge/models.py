@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from time import time
-import json
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class OrderBookEntry:
     exchange: str
     symbol: str
@@ -16,11 +17,21 @@ class OrderBookEntry:
     timestamp: float
 
     def to_json(self) -> str:
-        return json.dumps(asdict(self))
+        # Explicit dict literal: skips asdict()'s recursive copy on the
+        # per-tick path
+        return orjson.dumps({
+            "exchange": self.exchange,
+            "symbol": self.symbol,
+            "bid": self.bid,
+            "ask": self.ask,
+            "bid_volume": self.bid_volume,
+            "ask_volume": self.ask_volume,
+            "timestamp": self.timestamp,
+        }).decode()
 
     @classmethod
     def from_json(cls, data: str) -> OrderBookEntry:
-        return cls(**json.loads(data))
+        return cls(**orjson.loads(data))
 
     @property
     def mid_price(self) -> float:
@@ -33,7 +44,7 @@ class OrderBookEntry:
         return ((self.ask - self.bid) / self.bid) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadInfo:
     symbol: str
     buy_exchange: str
@@ -67,16 +78,15 @@ class SpreadInfo:
         # Direction 2: buy on B (ask), sell on A (bid)
         spread_2 = entry_a.bid - entry_b.ask
 
-        if spread_1 >= spread_2:
-            buy_exchange, sell_exchange = entry_a.exchange, entry_b.exchange
-            buy_price, sell_price = entry_a.ask, entry_b.bid
-            buy_volume, sell_volume = entry_a.ask_volume, entry_b.bid_volume
-            spread_abs = spread_1
-        else:
-            buy_exchange, sell_exchange = entry_b.exchange, entry_a.exchange
-            buy_price, sell_price = entry_b.ask, entry_a.bid
-            buy_volume, sell_volume = entry_b.ask_volume, entry_a.bid_volume
-            spread_abs = spread_2
+        # Single tuple pick instead of six per-branch assignments
+        buy, sell, spread_abs = (
+            (entry_a, entry_b, spread_1)
+            if spread_1 >= spread_2
+            else (entry_b, entry_a, spread_2)
+        )
+        buy_exchange, sell_exchange = buy.exchange, sell.exchange
+        buy_price, sell_price = buy.ask, sell.bid
+        buy_volume, sell_volume = buy.ask_volume, sell.bid_volume
 
         if buy_price == 0:
             return None
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from time import time
-import json
+
+import orjson
 
 
 def spot_to_perp(symbol: str) -> str:
@@ -13,7 +14,7 @@ def spot_to_perp(symbol: str) -> str:
     return f"{symbol}:{quote}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingRateEntry:
     exchange: str
     symbol: str  # perp symbol, e.g. BTC/USDT:USDT
@@ -39,14 +40,23 @@ class FundingRateEntry:
         return self.funding_rate * 100
 
     def to_json(self) -> str:
-        return json.dumps(asdict(self))
+        return orjson.dumps({
+            "exchange": self.exchange,
+            "symbol": self.symbol,
+            "spot_symbol": self.spot_symbol,
+            "funding_rate": self.funding_rate,
+            "funding_timestamp": self.funding_timestamp,
+            "next_funding_timestamp": self.next_funding_timestamp,
+            "next_funding_rate": self.next_funding_rate,
+            "timestamp": self.timestamp,
+        }).decode()
 
     @classmethod
     def from_json(cls, data: str) -> FundingRateEntry:
-        return cls(**json.loads(data))
+        return cls(**orjson.loads(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingRateSpread:
     symbol: str
     high_exchange: str
@@ -88,7 +98,7 @@ class FundingRateSpread:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SpotFundingArb:
     symbol: str
     exchange: str
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass
 from time import time
-import json
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class TradeSignal:
     action: str  # "open" or "close"
     exchange: str
@@ -22,15 +23,31 @@ class TradeSignal:
         if self.timestamp == 0.0:
             self.timestamp = time()
 
+    def to_dict(self) -> dict:
+        # Explicit dict literal: avoids asdict()'s recursive walk when
+        # signals are logged or persisted
+        return {
+            "action": self.action,
+            "exchange": self.exchange,
+            "symbol": self.symbol,
+            "perp_symbol": self.perp_symbol,
+            "direction": self.direction,
+            "size_usdt": self.size_usdt,
+            "funding_rate": self.funding_rate,
+            "annualized_rate": self.annualized_rate,
+            "reason": self.reason,
+            "timestamp": self.timestamp,
+        }
+
     def to_json(self) -> str:
-        return json.dumps(asdict(self))
+        return orjson.dumps(self.to_dict()).decode()
 
     @classmethod
     def from_json(cls, data: str) -> TradeSignal:
-        return cls(**json.loads(data))
+        return cls(**orjson.loads(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class LegFill:
     side: str  # "buy" or "sell"
     market_type: str  # "spot" or "perp"
@@ -44,15 +61,26 @@ class LegFill:
         if self.timestamp == 0.0:
             self.timestamp = time()
 
+    def to_dict(self) -> dict:
+        return {
+            "side": self.side,
+            "market_type": self.market_type,
+            "symbol": self.symbol,
+            "price": self.price,
+            "quantity": self.quantity,
+            "fee": self.fee,
+            "timestamp": self.timestamp,
+        }
+
     def to_json(self) -> str:
-        return json.dumps(asdict(self))
+        return orjson.dumps(self.to_dict()).decode()
 
     @classmethod
     def from_json(cls, data: str) -> LegFill:
-        return cls(**json.loads(data))
+        return cls(**orjson.loads(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     exchange: str
     symbol: str  # spot symbol
@@ -108,9 +136,35 @@ class Position:
         perp_pnl = (self.perp_entry_price - perp_price) * self.perp_quantity
         return spot_pnl + perp_pnl + self.funding_collected
 
+    def to_dict(self) -> dict:
+        return {
+            "exchange": self.exchange,
+            "symbol": self.symbol,
+            "perp_symbol": self.perp_symbol,
+            "direction": self.direction,
+            "status": self.status,
+            "size_usdt": self.size_usdt,
+            "spot_entry_price": self.spot_entry_price,
+            "spot_quantity": self.spot_quantity,
+            "spot_exit_price": self.spot_exit_price,
+            "perp_entry_price": self.perp_entry_price,
+            "perp_quantity": self.perp_quantity,
+            "perp_exit_price": self.perp_exit_price,
+            "entry_funding_rate": self.entry_funding_rate,
+            "entry_annualized_rate": self.entry_annualized_rate,
+            "funding_collected": self.funding_collected,
+            "last_funding_update": self.last_funding_update,
+            "opened_at": self.opened_at,
+            "closed_at": self.closed_at,
+            "realized_pnl": self.realized_pnl,
+            "paper": self.paper,
+            "tier": self.tier,
+            "exit_reason": self.exit_reason,
+        }
+
     def to_json(self) -> str:
-        return json.dumps(asdict(self))
+        return orjson.dumps(self.to_dict()).decode()
 
     @classmethod
     def from_json(cls, data: str) -> Position:
-        return cls(**json.loads(data))
+        return cls(**orjson.loads(data))
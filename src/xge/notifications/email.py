@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from time import gmtime, strftime
 
 import resend
 
@@ -10,6 +10,20 @@ from xge.models_trading import Position
 
 logger = logging.getLogger("xge.notifications.email")
 
+_ROW = "<tr><td><b>%s</b></td><td>%s</td></tr>"
+
+
+def _fmt_utc(ts: float) -> str:
+    """Format an epoch timestamp as UTC via the C strftime path."""
+    return strftime("%Y-%m-%d %H:%M:%S UTC", gmtime(ts))
+
+
+def _table(title: str, rows: list[tuple[str, str]]) -> str:
+    """Render a notification body as one join instead of chained f-strings."""
+    return "<h2>%s</h2><table>%s</table>" % (
+        title, "".join(_ROW % row for row in rows),
+    )
+
 
 class EmailNotifier:
     """Send trade notification emails via Resend."""
@@ -23,25 +37,20 @@ class EmailNotifier:
         mode = "PAPER" if position.paper else "LIVE"
         subject = f"[{mode}] Trade Opened: {position.symbol} on {position.exchange}"
 
-        opened_at = datetime.fromtimestamp(position.opened_at, tz=timezone.utc)
-
-        html = (
-            f"<h2>Trade Opened — {position.symbol}</h2>"
-            f"<table>"
-            f"<tr><td><b>Mode</b></td><td>{mode}</td></tr>"
-            f"<tr><td><b>Exchange</b></td><td>{position.exchange}</td></tr>"
-            f"<tr><td><b>Symbol</b></td><td>{position.symbol}</td></tr>"
-            f"<tr><td><b>Direction</b></td><td>{position.direction}</td></tr>"
-            f"<tr><td><b>Size</b></td><td>${position.size_usdt:.2f}</td></tr>"
-            f"<tr><td><b>Spot Entry Price</b></td><td>{position.spot_entry_price}</td></tr>"
-            f"<tr><td><b>Spot Quantity</b></td><td>{position.spot_quantity}</td></tr>"
-            f"<tr><td><b>Perp Entry Price</b></td><td>{position.perp_entry_price}</td></tr>"
-            f"<tr><td><b>Perp Quantity</b></td><td>{position.perp_quantity}</td></tr>"
-            f"<tr><td><b>Funding Rate</b></td><td>{position.entry_funding_rate * 100:.4f}%</td></tr>"
-            f"<tr><td><b>Annualized Rate</b></td><td>{position.entry_annualized_rate:.1f}%</td></tr>"
-            f"<tr><td><b>Opened At</b></td><td>{opened_at:%Y-%m-%d %H:%M:%S UTC}</td></tr>"
-            f"</table>"
-        )
+        html = _table(f"Trade Opened — {position.symbol}", [
+            ("Mode", mode),
+            ("Exchange", position.exchange),
+            ("Symbol", position.symbol),
+            ("Direction", position.direction),
+            ("Size", f"${position.size_usdt:.2f}"),
+            ("Spot Entry Price", f"{position.spot_entry_price}"),
+            ("Spot Quantity", f"{position.spot_quantity}"),
+            ("Perp Entry Price", f"{position.perp_entry_price}"),
+            ("Perp Quantity", f"{position.perp_quantity}"),
+            ("Funding Rate", f"{position.entry_funding_rate * 100:.4f}%"),
+            ("Annualized Rate", f"{position.entry_annualized_rate:.1f}%"),
+            ("Opened At", _fmt_utc(position.opened_at)),
+        ])
 
         try:
             resend.Emails.send({
@@ -60,8 +69,6 @@ class EmailNotifier:
         pnl_emoji = "+" if pnl >= 0 else ""
         subject = f"[{mode}] Trade Closed: {position.symbol} on {position.exchange} — {pnl_emoji}${pnl:.4f}"
 
-        opened_at = datetime.fromtimestamp(position.opened_at, tz=timezone.utc)
-        closed_at = datetime.fromtimestamp(position.closed_at, tz=timezone.utc)
         duration = position.closed_at - position.opened_at
         hours = duration / 3600
         if hours >= 24:
@@ -69,24 +76,21 @@ class EmailNotifier:
         else:
             duration_str = f"{hours:.1f} hours"
 
-        html = (
-            f"<h2>Trade Closed — {position.symbol}</h2>"
-            f"<table>"
-            f"<tr><td><b>Mode</b></td><td>{mode}</td></tr>"
-            f"<tr><td><b>Exchange</b></td><td>{position.exchange}</td></tr>"
-            f"<tr><td><b>Symbol</b></td><td>{position.symbol}</td></tr>"
-            f"<tr><td><b>Direction</b></td><td>{position.direction}</td></tr>"
-            f"<tr><td><b>Size</b></td><td>${position.size_usdt:.2f}</td></tr>"
-            f"<tr><td><b>Spot Entry</b></td><td>{position.spot_entry_price}</td></tr>"
-            f"<tr><td><b>Spot Exit</b></td><td>{position.spot_exit_price}</td></tr>"
-            f"<tr><td><b>Perp Entry</b></td><td>{position.perp_entry_price}</td></tr>"
-            f"<tr><td><b>Perp Exit</b></td><td>{position.perp_exit_price}</td></tr>"
-            f"<tr><td><b>Realized P&L</b></td><td><b>{pnl_emoji}${pnl:.4f}</b></td></tr>"
-            f"<tr><td><b>Duration</b></td><td>{duration_str}</td></tr>"
-            f"<tr><td><b>Opened At</b></td><td>{opened_at:%Y-%m-%d %H:%M:%S UTC}</td></tr>"
-            f"<tr><td><b>Closed At</b></td><td>{closed_at:%Y-%m-%d %H:%M:%S UTC}</td></tr>"
-            f"</table>"
-        )
+        html = _table(f"Trade Closed — {position.symbol}", [
+            ("Mode", mode),
+            ("Exchange", position.exchange),
+            ("Symbol", position.symbol),
+            ("Direction", position.direction),
+            ("Size", f"${position.size_usdt:.2f}"),
+            ("Spot Entry", f"{position.spot_entry_price}"),
+            ("Spot Exit", f"{position.spot_exit_price}"),
+            ("Perp Entry", f"{position.perp_entry_price}"),
+            ("Perp Exit", f"{position.perp_exit_price}"),
+            ("Realized P&L", f"<b>{pnl_emoji}${pnl:.4f}</b>"),
+            ("Duration", duration_str),
+            ("Opened At", _fmt_utc(position.opened_at)),
+            ("Closed At", _fmt_utc(position.closed_at)),
+        ])
 
         try:
             resend.Emails.send({
@@ -1,6 +1,29 @@
-from xge.trading.executor import TradeExecutor
-from xge.trading.position_manager import PositionManager
-from xge.trading.strategy import BasisTradeStrategy
-from xge.trading.delta_monitor import DeltaMonitor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from xge.trading.executor import TradeExecutor
+    from xge.trading.position_manager import PositionManager
+    from xge.trading.strategy import BasisTradeStrategy
+    from xge.trading.delta_monitor import DeltaMonitor
 
 __all__ = ["TradeExecutor", "PositionManager", "BasisTradeStrategy", "DeltaMonitor"]
+
+# Lazy re-exports (PEP 562): importing the package stays cheap, and ccxt
+# is only loaded once a name that needs it is actually touched.
+_LAZY = {
+    "TradeExecutor": "xge.trading.executor",
+    "PositionManager": "xge.trading.position_manager",
+    "BasisTradeStrategy": "xge.trading.strategy",
+    "DeltaMonitor": "xge.trading.delta_monitor",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
@@ -5,6 +5,8 @@ periods are needed to reach breakeven, using real exchange fee schedules.
 """
 from __future__ import annotations
 
+from functools import lru_cache
+
 from xge.trading.tier_config import get_fees
 
 # Funding periods per day (8h intervals)
@@ -13,6 +15,23 @@ PERIODS_PER_DAY = 3
 MAX_BREAKEVEN_PERIODS = 5 * PERIODS_PER_DAY  # 15 periods = 5 days
 
 
+@lru_cache(maxsize=32)
+def _fee_rates(
+    exchange: str, spot_fee: float | None, perp_fee: float | None
+) -> tuple[float, float]:
+    """Resolve (entry, exit) fee rates for an exchange with overrides.
+
+    Entry uses taker fees (market orders), exit targets perp maker fees
+    (limit orders). The (exchange, overrides) space is tiny, so the
+    schedule lookup and sums are computed once per combination.
+    """
+    fees = get_fees(exchange)
+    s_fee = spot_fee if spot_fee is not None else fees["spot"]
+    p_fee_entry = perp_fee if perp_fee is not None else fees["perp_taker"]
+    p_fee_exit = perp_fee if perp_fee is not None else fees["perp_maker"]
+    return s_fee + p_fee_entry, s_fee + p_fee_exit
+
+
 def calculate_breakeven(
     size_usdt: float,
     spot_entry_price: float,
@@ -48,20 +67,13 @@ def calculate_breakeven(
             "viable": bool,  # True if breakeven < MAX_BREAKEVEN_PERIODS
         }
     """
-    fees = get_fees(exchange)
-
-    # Use provided fees or defaults from schedule
-    # Entry: market orders → taker fees
-    # Exit: can target maker orders
-    s_fee = spot_fee if spot_fee is not None else fees["spot"]
-    p_fee_entry = perp_fee if perp_fee is not None else fees["perp_taker"]
-    p_fee_exit = perp_fee if perp_fee is not None else fees["perp_maker"]
+    entry_rate, exit_rate = _fee_rates(exchange, spot_fee, perp_fee)
 
     # Entry cost: spot taker + perp taker
-    entry_cost = size_usdt * (s_fee + p_fee_entry)
+    entry_cost = size_usdt * entry_rate
 
     # Exit cost: spot taker + perp maker (target limit orders on exit)
-    exit_cost = size_usdt * (s_fee + p_fee_exit)
+    exit_cost = size_usdt * exit_rate
 
     total_cost = entry_cost + exit_cost
 
@@ -10,19 +10,28 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import defaultdict
 from time import time
 
 from xge.cache.redis_cache import RedisCache
 from xge.models import OrderBookEntry
 from xge.models_trading import Position
 from xge.trading.position_manager import PositionManager
-from xge.trading.tier_config import get_tier_for_symbol, TIER_1, TIER_2
+from xge.trading.tier_config import TIERS, TIER_1, TIER_2
 
 logger = logging.getLogger("xge.trading.delta_monitor")
 
 CHECK_INTERVAL = 30  # seconds
 REBALANCE_TIMEOUT = 60  # seconds
 
+# Tier config is immutable for the process lifetime, so resolve each
+# symbol's drift threshold once at import instead of per position per cycle
+_TIER_THRESHOLD: dict[str, float] = {
+    symbol: tier["size_per_pair"] * tier["delta_alert_pct"]
+    for tier in TIERS
+    for symbol in tier["symbols"]
+}
+
 
 class DeltaMonitor:
     """Monitors delta drift and basis for open positions."""
@@ -35,7 +44,7 @@ class DeltaMonitor:
         self._cache = cache
         self._pm = position_manager
         self._running = False
-        self._negative_funding_counts: dict[str, int] = {}  # key -> count
+        self._negative_funding_counts: defaultdict[str, int] = defaultdict(int)
 
     async def run(self) -> None:
         """Main monitoring loop — runs every CHECK_INTERVAL seconds."""
@@ -60,12 +69,17 @@ class DeltaMonitor:
     async def _check_all_positions(self) -> None:
         """Check delta and basis for all open positions."""
         positions = await self._pm.get_all_positions()
+        open_positions = [p for p in positions if p.status == "open"]
+        if not open_positions:
+            return
 
-        for pos in positions:
-            if pos.status != "open":
-                continue
+        # One MGET for all books instead of a GET per position
+        spot_raws = await self._cache.mget(
+            [f"latest:{p.exchange}:{p.symbol}" for p in open_positions]
+        )
 
-            spot_raw = await self._cache.get_latest(pos.exchange, pos.symbol)
+        basis_writes: list[tuple[str, float, str]] = []
+        for pos, spot_raw in zip(open_positions, spot_raws):
             if not spot_raw:
                 continue
 
@@ -81,12 +95,8 @@ class DeltaMonitor:
             delta = spot_notional - perp_notional
 
             # ── Threshold from tier ─────────────────────────────────
-            tier = get_tier_for_symbol(pos.symbol)
-            if tier:
-                threshold = tier["size_per_pair"] * tier["delta_alert_pct"]
-            else:
-                # Fallback for positions not in any tier
-                threshold = pos.size_usdt * 0.02
+            # Fallback for positions not in any tier
+            threshold = _TIER_THRESHOLD.get(pos.symbol, pos.size_usdt * 0.02)
 
             # ── Basis calculation ───────────────────────────────────
             if perp_price > 0:
@@ -94,14 +104,14 @@ class DeltaMonitor:
             else:
                 basis_pct = 0.0
 
-            # Store basis in Redis with timestamp
+            # Record basis in a per-symbol sorted set (score = epoch
+            # seconds); writes are flushed in one pipeline after the sweep
             now = time()
-            basis_key = f"basis:{pos.exchange}:{pos.symbol}:{int(now)}"
-            await self._cache.set(
-                basis_key,
-                f"{basis_pct:.6f}",
-                ex=86400,  # 24h TTL
-            )
+            basis_writes.append((
+                f"basis:{pos.exchange}:{pos.symbol}",
+                now,
+                f"{int(now)}:{basis_pct:.6f}",
+            ))
 
             # ── Check drift ─────────────────────────────────────────
             if abs(delta) > threshold:
@@ -127,6 +137,8 @@ class DeltaMonitor:
                     pos.exchange, pos.symbol, delta, threshold, basis_pct,
                 )
 
+        await self._cache.zadd_series(basis_writes, retention=86400)  # keep 24h
+
     async def _attempt_rebalance(self, pos: Position, delta: float) -> bool:
         """Attempt to rebalance a drifted position with maker orders.
 
@@ -158,9 +170,7 @@ class DeltaMonitor:
         """
         key = f"{exchange}:{symbol}"
         if is_negative:
-            self._negative_funding_counts[key] = (
-                self._negative_funding_counts.get(key, 0) + 1
-            )
+            self._negative_funding_counts[key] += 1
         else:
             self._negative_funding_counts[key] = 0
         return self._negative_funding_counts[key]
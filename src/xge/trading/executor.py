@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
 from time import time
@@ -11,6 +13,23 @@ from xge.models_trading import TradeSignal, LegFill
 logger = logging.getLogger("xge.trading.executor")
 
 
+@functools.cache
+def _exchange_class(exchange_id: str):
+    """Resolve a ccxt.pro exchange class once per id."""
+    return getattr(ccxtpro, exchange_id, None)
+
+
+@functools.cache
+def _credentials(exchange_id: str) -> tuple[str, str, str]:
+    """Read (api_key, secret, password) from the environment once per id."""
+    upper = exchange_id.upper()
+    return (
+        os.environ.get(f"{upper}_API_KEY", ""),
+        os.environ.get(f"{upper}_SECRET", ""),
+        os.environ.get(f"{upper}_PASSWORD", ""),
+    )
+
+
 class TradeExecutor:
     """Executes trades on exchanges, either paper or live."""
 
@@ -27,14 +46,12 @@ class TradeExecutor:
         if exchange_id in self._exchanges:
             return
 
-        exchange_class = getattr(ccxtpro, exchange_id, None)
+        exchange_class = _exchange_class(exchange_id)
         if exchange_class is None:
             raise ValueError(f"Unknown exchange: {exchange_id}")
 
         upper = exchange_id.upper()
-        api_key = os.environ.get(f"{upper}_API_KEY", "")
-        secret = os.environ.get(f"{upper}_SECRET", "")
-        password = os.environ.get(f"{upper}_PASSWORD", "")
+        api_key, secret, password = _credentials(exchange_id)
 
         config: dict = {"enableRateLimit": True}
 
@@ -92,8 +109,10 @@ class TradeExecutor:
         self, exchange: ccxtpro.Exchange, signal: TradeSignal,
     ) -> tuple[LegFill, LegFill]:
         """Simulate open using ticker prices."""
-        spot_ticker = await exchange.fetch_ticker(signal.symbol)
-        perp_ticker = await exchange.fetch_ticker(signal.perp_symbol)
+        spot_ticker, perp_ticker = await asyncio.gather(
+            exchange.fetch_ticker(signal.symbol),
+            exchange.fetch_ticker(signal.perp_symbol),
+        )
 
         spot_price = float(spot_ticker["ask"] or spot_ticker["last"])
         perp_price = float(perp_ticker["bid"] or perp_ticker["last"])
@@ -136,8 +155,10 @@ class TradeExecutor:
         perp_quantity: float,
     ) -> tuple[LegFill, LegFill]:
         """Simulate close using ticker prices."""
-        spot_ticker = await exchange.fetch_ticker(signal.symbol)
-        perp_ticker = await exchange.fetch_ticker(signal.perp_symbol)
+        spot_ticker, perp_ticker = await asyncio.gather(
+            exchange.fetch_ticker(signal.symbol),
+            exchange.fetch_ticker(signal.perp_symbol),
+        )
 
         spot_price = float(spot_ticker["bid"] or spot_ticker["last"])
         perp_price = float(perp_ticker["ask"] or perp_ticker["last"])
@@ -174,20 +195,36 @@ class TradeExecutor:
         self, exchange: ccxtpro.Exchange, signal: TradeSignal,
     ) -> tuple[LegFill, LegFill]:
         """Execute real open orders."""
-        spot_ticker = await exchange.fetch_ticker(signal.symbol)
+        # Concurrent fetches also narrow the window between the two
+        # price snapshots, tightening the basis both legs are sized on
+        spot_ticker, perp_ticker = await asyncio.gather(
+            exchange.fetch_ticker(signal.symbol),
+            exchange.fetch_ticker(signal.perp_symbol),
+        )
         spot_price = float(spot_ticker["ask"] or spot_ticker["last"])
         spot_quantity = signal.size_usdt / spot_price
-
-        perp_ticker = await exchange.fetch_ticker(signal.perp_symbol)
         perp_price = float(perp_ticker["bid"] or perp_ticker["last"])
         perp_quantity = signal.size_usdt / perp_price
 
-        spot_order = await exchange.create_market_buy_order(
-            signal.symbol, spot_quantity,
-        )
-        perp_order = await exchange.create_market_sell_order(
-            signal.perp_symbol, perp_quantity,
+        # Fire both legs concurrently: sequential submission doubles
+        # leg latency and widens the delta-drift window between fills
+        spot_order, perp_order = await asyncio.gather(
+            exchange.create_market_buy_order(signal.symbol, spot_quantity),
+            exchange.create_market_sell_order(signal.perp_symbol, perp_quantity),
+            return_exceptions=True,
         )
+        if isinstance(spot_order, BaseException) or isinstance(perp_order, BaseException):
+            if not isinstance(spot_order, BaseException):
+                await self._unwind_leg(
+                    exchange, "sell", signal.symbol,
+                    float(spot_order.get("filled") or spot_quantity),
+                )
+            if not isinstance(perp_order, BaseException):
+                await self._unwind_leg(
+                    exchange, "buy", signal.perp_symbol,
+                    float(perp_order.get("filled") or perp_quantity),
+                )
+            raise spot_order if isinstance(spot_order, BaseException) else perp_order
 
         now = time()
         spot_fill = LegFill(
@@ -225,12 +262,25 @@ class TradeExecutor:
         perp_quantity: float,
     ) -> tuple[LegFill, LegFill]:
         """Execute real close orders."""
-        spot_order = await exchange.create_market_sell_order(
-            signal.symbol, spot_quantity,
-        )
-        perp_order = await exchange.create_market_buy_order(
-            signal.perp_symbol, perp_quantity,
+        spot_order, perp_order = await asyncio.gather(
+            exchange.create_market_sell_order(signal.symbol, spot_quantity),
+            exchange.create_market_buy_order(signal.perp_symbol, perp_quantity),
+            return_exceptions=True,
         )
+        if isinstance(spot_order, BaseException) or isinstance(perp_order, BaseException):
+            # Re-establish the closed leg so the position stays
+            # delta-neutral and the close can be retried whole
+            if not isinstance(spot_order, BaseException):
+                await self._unwind_leg(
+                    exchange, "buy", signal.symbol,
+                    float(spot_order.get("filled") or spot_quantity),
+                )
+            if not isinstance(perp_order, BaseException):
+                await self._unwind_leg(
+                    exchange, "sell", signal.perp_symbol,
+                    float(perp_order.get("filled") or perp_quantity),
+                )
+            raise spot_order if isinstance(spot_order, BaseException) else perp_order
 
         now = time()
         spot_fill = LegFill(
@@ -260,6 +310,32 @@ class TradeExecutor:
         )
         return spot_fill, perp_fill
 
+    async def _unwind_leg(
+        self,
+        exchange: ccxtpro.Exchange,
+        side: str,
+        symbol: str,
+        quantity: float,
+    ) -> None:
+        """Counter-order a filled leg after its sibling failed."""
+        if quantity <= 0:
+            return
+        try:
+            if side == "buy":
+                await exchange.create_market_buy_order(symbol, quantity)
+            else:
+                await exchange.create_market_sell_order(symbol, quantity)
+            logger.warning(
+                "[LIVE] Unwound %s leg %.6f %s after partial failure",
+                side, quantity, symbol,
+            )
+        except Exception:
+            logger.critical(
+                "[LIVE] FAILED to unwind %s leg %.6f %s — "
+                "manual intervention required",
+                side, quantity, symbol,
+            )
+
     async def disconnect(self) -> None:
         """Close all exchange connections."""
         for exchange_id, exchange in self._exchanges.items():
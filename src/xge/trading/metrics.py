@@ -6,6 +6,7 @@ capital allocation, and generates formatted reports.
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from time import time
 
 from xge.cache.redis_cache import RedisCache
@@ -30,23 +31,41 @@ async def calculate_metrics(
     closed_trades = [t for t in history if t.status in ("closed", "stale_closed")]
     total_trades = len(closed_trades)
 
-    # ── Trade performance ───────────────────────────────────────────
-    total_realized_pnl = sum(t.realized_pnl for t in closed_trades)
-    total_funding = sum(t.funding_collected for t in closed_trades)
-    positive_trades = sum(1 for t in closed_trades if t.realized_pnl > 0)
+    # ── Single-pass aggregation over trade history ──────────────────
+    # One loop with accumulators instead of re-walking the list per metric
+    total_realized_pnl = 0.0
+    total_funding = 0.0
+    total_size = 0.0
+    positive_trades = 0
+    basis_sum = 0.0
+    basis_n = 0
+    first_trade_time = float("inf")
+    pair_pnl: defaultdict[str, float] = defaultdict(float)
+    pair_funding: defaultdict[str, float] = defaultdict(float)
+    pair_size: defaultdict[str, float] = defaultdict(float)
 
-    win_rate = (positive_trades / total_trades * 100) if total_trades > 0 else 0.0
-    avg_pnl = total_realized_pnl / total_trades if total_trades > 0 else 0.0
-
-    # ── Per-pair metrics ────────────────────────────────────────────
-    pair_pnl: dict[str, float] = {}
-    pair_funding: dict[str, float] = {}
-    pair_size: dict[str, float] = {}
     for t in closed_trades:
+        total_realized_pnl += t.realized_pnl
+        total_funding += t.funding_collected
+        total_size += t.size_usdt
+        if t.realized_pnl > 0:
+            positive_trades += 1
+        if t.perp_entry_price > 0:
+            basis_sum += (
+                abs(t.spot_entry_price - t.perp_entry_price)
+                / t.perp_entry_price * 100
+            )
+            basis_n += 1
+        if t.opened_at < first_trade_time:
+            first_trade_time = t.opened_at
+
         key = f"{t.exchange}:{t.symbol}"
-        pair_pnl[key] = pair_pnl.get(key, 0) + t.realized_pnl
-        pair_funding[key] = pair_funding.get(key, 0) + t.funding_collected
-        pair_size[key] = pair_size.get(key, 0) + t.size_usdt
+        pair_pnl[key] += t.realized_pnl
+        pair_funding[key] += t.funding_collected
+        pair_size[key] += t.size_usdt
+
+    win_rate = (positive_trades / total_trades * 100) if total_trades > 0 else 0.0
+    avg_pnl = total_realized_pnl / total_trades if total_trades > 0 else 0.0
 
     # Net PnL ratio per pair
     pair_ratio = {}
@@ -58,16 +77,10 @@ async def calculate_metrics(
     worst_pair = min(pair_ratio, key=pair_ratio.get, default="N/A") if pair_ratio else "N/A"
 
     # ── Funding yield ───────────────────────────────────────────────
-    total_size = sum(t.size_usdt for t in closed_trades)
     funding_yield = (total_funding / total_size * 100) if total_size > 0 else 0.0
 
     # ── Basis cost average ──────────────────────────────────────────
-    basis_costs = []
-    for t in closed_trades:
-        if t.perp_entry_price > 0:
-            bc = abs(t.spot_entry_price - t.perp_entry_price) / t.perp_entry_price * 100
-            basis_costs.append(bc)
-    avg_basis_cost = sum(basis_costs) / len(basis_costs) if basis_costs else 0.0
+    avg_basis_cost = basis_sum / basis_n if basis_n else 0.0
 
     # ── Capital metrics ─────────────────────────────────────────────
     capital_deployed = sum(p.size_usdt for p in open_positions)
@@ -88,7 +101,6 @@ async def calculate_metrics(
 
     # ── Projected monthly yield ─────────────────────────────────────
     if closed_trades:
-        first_trade_time = min(t.opened_at for t in closed_trades)
         days_active = max((time() - first_trade_time) / 86400, 1)
         projected_monthly = (funding_yield / days_active) * 30
     else:
@@ -5,6 +5,7 @@ to ensure a pair meets quality thresholds.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from time import time
 
@@ -62,64 +63,78 @@ async def validate_pair(
         result["reasons"].append(f"{symbol} not assigned to any tier")
         return result
 
+    # All remaining checks hit independent exchange endpoints; fetch
+    # them concurrently so the validation pass costs one RTT, not six
+    since_ms = int((time() - MIN_CONSECUTIVE_POSITIVE_DAYS * 86400) * 1000)
+    since_24h = int((time() - 86400) * 1000)
+    funding, history, spot_ticker, perp_ticker, oi_data, oi_history = (
+        await asyncio.gather(
+            exchange.fetch_funding_rate(perp_symbol),
+            exchange.fetch_funding_rate_history(
+                perp_symbol, since=since_ms, limit=100,
+            ),
+            exchange.fetch_ticker(symbol),
+            exchange.fetch_ticker(perp_symbol),
+            exchange.fetch_open_interest(perp_symbol),
+            exchange.fetch_open_interest_history(
+                perp_symbol, timeframe="1d", since=since_24h, limit=2,
+            ),
+            return_exceptions=True,
+        )
+    )
+
     # ── 1. Current funding rate ─────────────────────────────────────
-    try:
-        funding = await exchange.fetch_funding_rate(perp_symbol)
-        current_rate = float(funding.get("fundingRate", 0))
-        if current_rate <= MIN_FUNDING_RATE:
-            result["approved"] = False
-            result["reasons"].append(
-                f"Current funding {current_rate:.6f} <= {MIN_FUNDING_RATE}"
-            )
-    except Exception as e:
+    if isinstance(funding, BaseException):
         result["approved"] = False
-        result["reasons"].append(f"Failed to fetch funding rate: {e}")
+        result["reasons"].append(f"Failed to fetch funding rate: {funding}")
         return result
+    current_rate = float(funding.get("fundingRate") or 0)
+    if current_rate <= MIN_FUNDING_RATE:
+        result["approved"] = False
+        result["reasons"].append(
+            f"Current funding {current_rate:.6f} <= {MIN_FUNDING_RATE}"
+        )
 
     # ── 2. 3-day funding history (allow up to 1 negative) ───────────
-    try:
-        since_ms = int((time() - MIN_CONSECUTIVE_POSITIVE_DAYS * 86400) * 1000)
-        history = await exchange.fetch_funding_rate_history(
-            perp_symbol, since=since_ms, limit=100,
-        )
-        if history:
-            rates = [float(h.get("fundingRate", 0)) for h in history]
-            result["funding_7d_avg"] = sum(rates) / len(rates)
-
-            # Check last 3 days (~9 funding periods), allow at most 1 negative
-            expected_periods = MIN_CONSECUTIVE_POSITIVE_DAYS * 3  # 9
-            if len(rates) >= expected_periods:
-                recent = rates[-expected_periods:]
-            else:
-                recent = rates
-
-            negative_count = sum(1 for r in recent if r <= 0)
-            max_negative_allowed = 1
-            if negative_count > max_negative_allowed:
-                result["approved"] = False
-                result["reasons"].append(
-                    f"Too many non-positive funding periods "
-                    f"({negative_count}/{len(recent)} non-positive, "
-                    f"max {max_negative_allowed} allowed)"
-                )
-        else:
-            result["approved"] = False
-            result["reasons"].append("No funding history available")
-    except Exception as e:
+    if isinstance(history, BaseException):
         logger.warning(
             "Could not fetch funding history for %s on %s: %s",
-            perp_symbol, exchange_id, e,
+            perp_symbol, exchange_id, history,
         )
         # Don't block on history fetch failure — some exchanges don't support it
-        result["reasons"].append(f"Funding history unavailable: {e}")
+        result["reasons"].append(f"Funding history unavailable: {history}")
+    elif history:
+        rates = [float(h.get("fundingRate") or 0) for h in history]
+        result["funding_7d_avg"] = sum(rates) / len(rates)
+
+        # Check last 3 days (~9 funding periods), allow at most 1 negative
+        expected_periods = MIN_CONSECUTIVE_POSITIVE_DAYS * 3  # 9
+        if len(rates) >= expected_periods:
+            recent = rates[-expected_periods:]
+        else:
+            recent = rates
 
-    # ── 3. Spot-perp spread ─────────────────────────────────────────
-    try:
-        spot_ticker = await exchange.fetch_ticker(symbol)
-        perp_ticker = await exchange.fetch_ticker(perp_symbol)
+        negative_count = sum(1 for r in recent if r <= 0)
+        max_negative_allowed = 1
+        if negative_count > max_negative_allowed:
+            result["approved"] = False
+            result["reasons"].append(
+                f"Too many non-positive funding periods "
+                f"({negative_count}/{len(recent)} non-positive, "
+                f"max {max_negative_allowed} allowed)"
+            )
+    else:
+        result["approved"] = False
+        result["reasons"].append("No funding history available")
 
-        spot_price = float(spot_ticker.get("last", 0))
-        perp_price = float(perp_ticker.get("last", 0))
+    # ── 3. Spot-perp spread ─────────────────────────────────────────
+    if isinstance(spot_ticker, BaseException) or isinstance(perp_ticker, BaseException):
+        err = spot_ticker if isinstance(spot_ticker, BaseException) else perp_ticker
+        result["approved"] = False
+        result["reasons"].append(f"Failed to fetch prices: {err}")
+    else:
+        spot_price = float(spot_ticker.get("last") or 0)
+        perp_price = float(perp_ticker.get("last") or 0)
 
         if perp_price > 0:
             spread = abs(spot_price - perp_price) / perp_price
@@ -129,13 +144,12 @@ async def validate_pair(
                 result["reasons"].append(
                     f"Spread {spread:.6f} > {MAX_SPREAD} ({spread*100:.4f}%)"
                 )
-    except Exception as e:
-        result["approved"] = False
-        result["reasons"].append(f"Failed to fetch prices: {e}")
 
-    # ── 4. 24h perp volume ──────────────────────────────────────────
-    try:
-        perp_ticker = await exchange.fetch_ticker(perp_symbol)
+    # ── 4. 24h perp volume (reuses the perp ticker from above) ──────
+    if isinstance(perp_ticker, BaseException):
+        result["approved"] = False
+        result["reasons"].append(f"Failed to fetch volume: {perp_ticker}")
+    else:
         quote_volume = float(perp_ticker.get("quoteVolume", 0) or 0)
         result["volume_24h"] = quote_volume
         if quote_volume < MIN_VOLUME_24H:
@@ -143,47 +157,37 @@ async def validate_pair(
             result["reasons"].append(
                 f"24h volume ${quote_volume:,.0f} < ${MIN_VOLUME_24H:,.0f}"
             )
-    except Exception as e:
-        result["approved"] = False
-        result["reasons"].append(f"Failed to fetch volume: {e}")
 
     # ── 5. Open Interest stability ──────────────────────────────────
-    try:
-        oi_data = await exchange.fetch_open_interest(perp_symbol)
+    if isinstance(oi_data, BaseException):
+        logger.debug(
+            "Could not fetch OI for %s on %s: %s", perp_symbol, exchange_id, oi_data,
+        )
+        # OI check is non-blocking for exchanges that don't support it
+    else:
         current_oi = float(oi_data.get("openInterestValue", 0) or 0)
 
-        # Try to get historical OI (24h ago) — not all exchanges support this
-        oi_change = 0.0
-        try:
-            since_24h = int((time() - 86400) * 1000)
-            oi_history = await exchange.fetch_open_interest_history(
-                perp_symbol, timeframe="1d", since=since_24h, limit=2,
-            )
-            if oi_history and len(oi_history) >= 2:
-                prev_oi = float(
-                    oi_history[0].get("openInterestValue", 0)
-                    or oi_history[0].get("openInterestAmount", 0)
-                    or 0
-                )
-                if prev_oi > 0:
-                    oi_change = (current_oi - prev_oi) / prev_oi
-                    result["open_interest_change"] = oi_change
-                    if oi_change < -MAX_OI_DROP_PCT:
-                        result["approved"] = False
-                        result["reasons"].append(
-                            f"OI dropped {oi_change*100:.1f}% > "
-                            f"-{MAX_OI_DROP_PCT*100:.0f}% threshold"
-                        )
-        except Exception:
+        # Historical OI (24h ago) — not all exchanges support this
+        if isinstance(oi_history, BaseException):
             # OI history not available on all exchanges — non-blocking
             logger.debug(
                 "OI history not available for %s on %s", perp_symbol, exchange_id,
             )
-    except Exception as e:
-        logger.debug(
-            "Could not fetch OI for %s on %s: %s", perp_symbol, exchange_id, e,
-        )
-        # OI check is non-blocking for exchanges that don't support it
+        elif oi_history and len(oi_history) >= 2:
+            prev_oi = float(
+                oi_history[0].get("openInterestValue", 0)
+                or oi_history[0].get("openInterestAmount", 0)
+                or 0
+            )
+            if prev_oi > 0:
+                oi_change = (current_oi - prev_oi) / prev_oi
+                result["open_interest_change"] = oi_change
+                if oi_change < -MAX_OI_DROP_PCT:
+                    result["approved"] = False
+                    result["reasons"].append(
+                        f"OI dropped {oi_change*100:.1f}% > "
+                        f"-{MAX_OI_DROP_PCT*100:.0f}% threshold"
+                    )
 
     level = logging.INFO if result["approved"] else logging.DEBUG
     logger.log(
@@ -8,6 +8,10 @@ from xge.models_trading import Position
 
 logger = logging.getLogger("xge.trading.position_manager")
 
+# Redis SET holding the keys of all open positions, so listings cost
+# SMEMBERS + MGET instead of a SCAN over the whole keyspace
+INDEX_KEY = "positions:index"
+
 
 class PositionManager:
     """Manages trading positions stored in Redis."""
@@ -21,44 +25,70 @@ class PositionManager:
         self._cache = cache
         self._max_per_exchange = max_positions_per_exchange
         self._max_total = max_total_positions
+        # In-process index of open positions keyed by redis_key; Redis
+        # stays the source of truth and seeds it once after a restart.
+        self._open: dict[str, Position] | None = None
+        # Parsed trade_history entries plus how many list items they
+        # cover, so each read only fetches what was appended since.
+        self._history: list[Position] = []
+        self._history_len = 0
+
+    async def _open_index(self) -> dict[str, Position]:
+        """Hydrate the open-positions index from Redis on first use."""
+        if self._open is None:
+            keys = sorted(await self._cache.smembers(INDEX_KEY))
+            if not keys:
+                # One-shot migration for deploys that predate the index
+                keys = await self._cache.scan_keys("position:*")
+            raws = await self._cache.mget(keys)
+            self._open = {
+                key: Position.from_json(raw)
+                for key, raw in zip(keys, raws)
+                if raw
+            }
+            # Rebuild the index: drops members whose keys hit their TTL
+            # and seeds it on migration
+            pipe = self._cache.pipeline()
+            pipe.delete(INDEX_KEY)
+            if self._open:
+                pipe.sadd(INDEX_KEY, *self._open)
+            await pipe.execute()
+        return self._open
 
     async def get_position(self, exchange: str, symbol: str) -> Position | None:
         """Get an open position for exchange/symbol, or None."""
-        key = f"position:{exchange}:{symbol}"
-        raw = await self._cache.get(key)
-        if raw:
-            return Position.from_json(raw)
-        return None
+        index = await self._open_index()
+        return index.get(f"position:{exchange}:{symbol}")
 
     async def save_position(self, position: Position) -> None:
         """Save a position to Redis. Remove key if closed."""
+        index = await self._open_index()
+        pipe = self._cache.pipeline()
         if position.status == "closed":
-            await self._cache.delete(position.redis_key)
-            await self._cache.rpush("trade_history", position.to_json())
+            index.pop(position.redis_key, None)
+            pipe.delete(position.redis_key)
+            pipe.srem(INDEX_KEY, position.redis_key)
+            pipe.rpush("trade_history", position.to_json())
+            await pipe.execute()
             logger.info(
                 "Removed closed position %s from Redis (persisted to trade_history)",
                 position.redis_key,
             )
         else:
-            await self._cache.set(position.redis_key, position.to_json(), ex=7 * 86400)
+            index[position.redis_key] = position
+            pipe.set(position.redis_key, position.to_json(), ex=7 * 86400)
+            pipe.sadd(INDEX_KEY, position.redis_key)
+            await pipe.execute()
             logger.debug("Saved position %s (TTL=7d)", position.redis_key)
 
     async def get_all_positions(
         self, exchange: str | None = None,
     ) -> list[Position]:
         """Get all open positions, optionally filtered by exchange."""
+        index = await self._open_index()
         if exchange:
-            pattern = f"position:{exchange}:*"
-        else:
-            pattern = "position:*"
-
-        keys = await self._cache.scan_keys(pattern)
-        positions: list[Position] = []
-        for key in keys:
-            raw = await self._cache.get(key)
-            if raw:
-                positions.append(Position.from_json(raw))
-        return positions
+            return [p for p in index.values() if p.exchange == exchange]
+        return list(index.values())
 
     async def can_open(
         self, exchange: str, symbol: str,
@@ -101,6 +131,8 @@ class PositionManager:
         positions = await self.get_all_positions()
         now = time()
         cleaned = 0
+        # Batch the per-position delete + history push into one pipeline
+        pipe = self._cache.pipeline()
         for pos in positions:
             should_close = False
             reason = ""
@@ -122,16 +154,31 @@ class PositionManager:
                 pos.closed_at = now
                 pos.realized_pnl = 0.0
                 pos.exit_reason = "reconciled"
-                await self._cache.delete(pos.redis_key)
-                await self._cache.rpush("trade_history", pos.to_json())
+                if self._open is not None:
+                    self._open.pop(pos.redis_key, None)
+                pipe.delete(pos.redis_key)
+                pipe.srem(INDEX_KEY, pos.redis_key)
+                pipe.rpush("trade_history", pos.to_json())
                 logger.warning(
                     "Reconciled position %s: %s",
                     pos.redis_key, reason,
                 )
                 cleaned += 1
+        if cleaned:
+            await pipe.execute()
         return cleaned
 
     async def get_trade_history(self) -> list[Position]:
-        """Read all closed trades from the persistent trade_history list."""
-        raw_list = await self._cache.lrange("trade_history", 0, -1)
-        return [Position.from_json(raw) for raw in raw_list]
+        """Read all closed trades from the persistent trade_history list.
+
+        Only entries appended since the previous call are fetched and
+        parsed; earlier ones are served from the in-process cache, so
+        the scheduled metrics pass costs O(new trades), not O(history).
+        """
+        new_raws = await self._cache.lrange(
+            "trade_history", self._history_len, -1,
+        )
+        if new_raws:
+            self._history.extend(Position.from_json(raw) for raw in new_raws)
+            self._history_len += len(new_raws)
+        return self._history
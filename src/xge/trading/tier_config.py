@@ -1,6 +1,8 @@
 """Tier-based capital allocation and fee configuration for basis trading."""
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 # ── Capital allocation ──────────────────────────────────────────────
 CAPITAL_CONFIG = {
@@ -78,8 +80,12 @@ def get_tier_for_symbol(symbol: str) -> dict | None:
     return None
 
 
+@lru_cache(maxsize=8)
 def get_fees(exchange: str) -> dict[str, float]:
-    """Return fee schedule for an exchange, with safe defaults."""
+    """Return fee schedule for an exchange, with safe defaults.
+
+    Cached per exchange; callers must treat the result as read-only.
+    """
     return FEE_SCHEDULE.get(exchange, {
         "spot": 0.001,
         "perp_maker": 0.0005,
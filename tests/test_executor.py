@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from xge.models_trading import TradeSignal
+from xge.trading.executor import TradeExecutor
+
+
+def _make_signal(action: str = "open") -> TradeSignal:
+    return TradeSignal(
+        action=action,
+        exchange="bitget",
+        symbol="BTC/USDT",
+        perp_symbol="BTC/USDT:USDT",
+        direction="long_spot_short_perp",
+        size_usdt=100.0,
+        funding_rate=0.0003,
+        annualized_rate=32.85,
+        reason="test",
+    )
+
+
+def _make_executor(exchange: AsyncMock) -> TradeExecutor:
+    executor = TradeExecutor(paper=False)
+    executor._exchanges["bitget"] = exchange
+    return executor
+
+
+@pytest.mark.asyncio
+class TestLiveLegUnwind:
+    async def test_open_unwinds_spot_when_perp_leg_fails(self):
+        """A failed perp leg should counter-sell the filled spot leg."""
+        exchange = AsyncMock()
+        exchange.fetch_ticker = AsyncMock(side_effect=lambda sym: {
+            "ask": 50000.0, "bid": 50000.0, "last": 50000.0,
+        })
+        exchange.create_market_buy_order = AsyncMock(return_value={
+            "filled": 0.002, "average": 50000.0, "fee": {"cost": 0.1},
+        })
+
+        async def _sell(symbol, quantity):
+            if ":" in symbol:
+                raise RuntimeError("perp order rejected")
+            return {"filled": quantity}
+
+        exchange.create_market_sell_order = AsyncMock(side_effect=_sell)
+        executor = _make_executor(exchange)
+
+        with pytest.raises(RuntimeError, match="perp order rejected"):
+            await executor.execute_open(_make_signal())
+
+        # The spot leg was unwound with its filled quantity
+        exchange.create_market_sell_order.assert_any_call("BTC/USDT", 0.002)
+
+    async def test_open_unwind_handles_none_filled(self):
+        """ccxt returns "filled": None right after creation; the unwind
+        must fall back to the requested quantity, not raise TypeError."""
+        exchange = AsyncMock()
+        exchange.fetch_ticker = AsyncMock(side_effect=lambda sym: {
+            "ask": 50000.0, "bid": 50000.0, "last": 50000.0,
+        })
+        exchange.create_market_buy_order = AsyncMock(return_value={
+            "filled": None, "average": None,
+        })
+
+        async def _sell(symbol, quantity):
+            if ":" in symbol:
+                raise RuntimeError("perp order rejected")
+            return {"filled": quantity}
+
+        exchange.create_market_sell_order = AsyncMock(side_effect=_sell)
+        executor = _make_executor(exchange)
+
+        with pytest.raises(RuntimeError, match="perp order rejected"):
+            await executor.execute_open(_make_signal())
+
+        # Falls back to the requested quantity (size_usdt / ask price)
+        exchange.create_market_sell_order.assert_any_call(
+            "BTC/USDT", pytest.approx(100.0 / 50000.0),
+        )
+
+    async def test_close_rebuys_spot_when_perp_leg_fails(self):
+        """A failed perp close should re-buy the sold spot leg so the
+        position stays delta-neutral for a retry."""
+        exchange = AsyncMock()
+        exchange.create_market_sell_order = AsyncMock(return_value={
+            "filled": 0.002, "average": 50000.0, "fee": {"cost": 0.1},
+        })
+        async def _buy(symbol, quantity):
+            if ":" in symbol:
+                raise RuntimeError("perp close rejected")
+            return {"filled": quantity}
+
+        exchange.create_market_buy_order = AsyncMock(side_effect=_buy)
+        executor = _make_executor(exchange)
+
+        with pytest.raises(RuntimeError, match="perp close rejected"):
+            await executor.execute_close(
+                _make_signal(action="close"),
+                spot_quantity=0.002,
+                perp_quantity=0.002,
+            )
+
+        exchange.create_market_buy_order.assert_any_call("BTC/USDT", 0.002)